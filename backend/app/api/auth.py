@@ -1,14 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, Body, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Any, Optional
+import asyncio
+import hashlib
+import logging
+import time
 import jwt
-from datetime import datetime
-from app.core.database import get_database
+from datetime import datetime, timezone
+from pydantic import BaseModel
+from app.core import database
+from app.utils.cache import CacheManager
 
 # Import the Google Auth library
 from google.oauth2 import id_token
 from google.auth.transport import requests
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 security = HTTPBearer()
 
@@ -17,17 +26,54 @@ security = HTTPBearer()
 # It's the same one you're using in your frontend.
 GOOGLE_CLIENT_ID = str # It's recommended to load this from an environment variable
 
+# Cache verified tokens so repeated requests from the same client skip the
+# round-trip to Google's servers. Keys are SHA-256 hashes so raw tokens are
+# never held in memory.
+token_cache = CacheManager(default_ttl=300)
+
+# Reuse a single transport Request so the underlying HTTP session (and the
+# Google signing keys it caches) are shared across verifications.
+google_request = requests.Request()
+
+# Request models - parsed and validated by pydantic-core in one pass,
+# so malformed payloads are rejected before any handler work runs
+class GoogleSigninRequest(BaseModel):
+    googleId: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    avatar: Optional[str] = None
+    token: Optional[str] = None
+    device: str = "unknown"
+
+class TrackActivityRequest(BaseModel):
+    type: Optional[str] = None
+    details: Dict[str, Any] = {}
+    sessionId: Optional[str] = None
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """
     Securely validates a Google ID token and returns the user's information.
     """
     token = credentials.credentials
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached_info = token_cache.get(cache_key)
+    if cached_info is not None:
+        return cached_info
+
     try:
-        # Verify the token with Google's servers
-        id_info = id_token.verify_oauth2_token(
-            token, requests.Request(), GOOGLE_CLIENT_ID
+        # Verify the token with Google's servers. The verify is blocking
+        # (key fetch + RSA check), so run it in the threadpool rather than
+        # stalling the event loop on a cache miss.
+        id_info = await run_in_threadpool(
+            id_token.verify_oauth2_token,
+            token, google_request, GOOGLE_CLIENT_ID
         )
 
+        # Cache until shortly before the token expires (at most 5 minutes)
+        ttl = min(300, int(id_info.get("exp", 0) - time.time()) - 30)
+        if ttl > 0:
+            token_cache.set(cache_key, id_info, ttl=ttl)
+
         # The 'sub' field is Google's unique identifier for the user.
         return id_info
 
@@ -46,74 +92,58 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         )
 
 @router.post("/google-signin")
-async def google_signin(user_data: Dict[str, Any], db=Depends(get_database)):
+async def google_signin(user_data: GoogleSigninRequest):
     """
     Handle Google OAuth signin/signup
     Store user data in MongoDB
     """
     try:
-        # Get users collection
-        users_collection = db.get_collection("users")
-
-        # Check if user already exists
-        existing_user = await users_collection.find_one({"googleId": user_data.get("googleId")})
+        # Resolve the timestamp once up front
+        now = datetime.now(timezone.utc)
+        google_id = user_data.googleId
+
+        new_session = {
+            "userId": google_id,
+            "startTime": now,
+            "active": True,
+            "device": user_data.device,
+            "lastActivity": now
+        }
 
-        if existing_user:
-            # Update existing user's last login and token
-            await users_collection.update_one(
-                {"googleId": user_data.get("googleId")},
+        # A single upsert replaces the find_one + update/insert branching:
+        # $set carries the login-time fields, $setOnInsert the creation-only
+        # ones, and upserted_id tells us whether the user is new. This also
+        # makes concurrent sign-ins race-free thanks to the unique googleId
+        # index. The session insert is independent, so it runs concurrently.
+        result, _ = await asyncio.gather(
+            database.users_coll.update_one(
+                {"googleId": google_id},
                 {
                     "$set": {
-                        "lastLogin": datetime.now(),
-                        "token": user_data.get("token"),
-                        "name": user_data.get("name"),
-                        "email": user_data.get("email"),
-                        "avatar": user_data.get("avatar")
+                        "lastLogin": now,
+                        "token": user_data.token,
+                        "name": user_data.name,
+                        "email": user_data.email,
+                        "avatar": user_data.avatar
+                    },
+                    "$setOnInsert": {
+                        "createdAt": now
                     }
-                }
-            )
-
-            # Create a new session
-            await db.get_collection("sessions").insert_one({
-                "userId": user_data.get("googleId"),
-                "startTime": datetime.now(),
-                "active": True,
-                "device": user_data.get("device", "unknown"),
-                "lastActivity": datetime.now()
-            })
-
-            return {"status": "success", "message": "User logged in successfully", "isNewUser": False}
-        else:
-            # Create new user
-            new_user = {
-                "googleId": user_data.get("googleId"),
-                "name": user_data.get("name"),
-                "email": user_data.get("email"),
-                "avatar": user_data.get("avatar"),
-                "token": user_data.get("token"),
-                "createdAt": datetime.now(),
-                "lastLogin": datetime.now(),
-                "chats": []
-            }
-
-            result = await users_collection.insert_one(new_user)
-
-            # Create a new session
-            await db.get_collection("sessions").insert_one({
-                "userId": user_data.get("googleId"),
-                "startTime": datetime.now(),
-                "active": True,
-                "device": user_data.get("device", "unknown"),
-                "lastActivity": datetime.now()
-            })
-
-            return {"status": "success", "message": "User created successfully", "isNewUser": True}
+                },
+                upsert=True
+            ),
+            database.sessions_coll.insert_one(new_session)
+        )
+
+        is_new_user = result.upserted_id is not None
+        message = "User created successfully" if is_new_user else "User logged in successfully"
+        return {"status": "success", "message": message, "isNewUser": is_new_user}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error in Google signin: {str(e)}")
 
 @router.post("/logout")
-async def logout(data: Dict[str, str] = Body(...), db=Depends(get_database)):
+async def logout(data: Dict[str, str] = Body(...)):
     """
     Handle user logout
     Update session in database
@@ -124,9 +154,9 @@ async def logout(data: Dict[str, str] = Body(...), db=Depends(get_database)):
             raise HTTPException(status_code=400, detail="User ID is required")
 
         # Update all active sessions for this user to inactive
-        result = await db.get_collection("sessions").update_many(
+        result = await database.sessions_coll.update_many(
             {"userId": user_id, "active": True},
-            {"$set": {"active": False, "endTime": datetime.now()}}
+            {"$set": {"active": False, "endTime": datetime.now(timezone.utc)}}
         )
 
         return {"status": "success", "message": "Logged out successfully"}
@@ -136,9 +166,8 @@ async def logout(data: Dict[str, str] = Body(...), db=Depends(get_database)):
 
 @router.post("/track-activity")
 async def track_activity(
-    activity_data: Dict[str, Any],
-    user=Depends(get_current_user),
-    db=Depends(get_database)
+    activity_data: TrackActivityRequest,
+    user=Depends(get_current_user)
 ):
     """
     Track user activity
@@ -147,29 +176,31 @@ async def track_activity(
     try:
         # Get the user ID from the token
         user_id = user.get("sub")
+        now = datetime.now(timezone.utc)
+        session_id = activity_data.sessionId
 
         # Create activity document
         activity = {
             "userId": user_id,
-            "timestamp": datetime.now(),
-            "type": activity_data.get("type"),
-            "details": activity_data.get("details", {}),
-            "sessionId": activity_data.get("sessionId")
+            "timestamp": now,
+            "type": activity_data.type,
+            "details": activity_data.details,
+            "sessionId": session_id
         }
 
-        # Store activity in database
-        await db.get_collection("user_activities").insert_one(activity)
-
-        # Update last activity timestamp in session
-        if activity_data.get("sessionId"):
-            await db.get_collection("sessions").update_one(
-                {"_id": activity_data.get("sessionId")},
-                {"$set": {"lastActivity": datetime.now()}}
-            )
+        # The activity insert and the session touch are independent, so run
+        # them concurrently instead of serializing the two round-trips
+        writes = [database.activities_coll.insert_one(activity)]
+        if session_id:
+            writes.append(database.sessions_coll.update_one(
+                {"_id": session_id},
+                {"$set": {"lastActivity": now}}
+            ))
+        await asyncio.gather(*writes)
 
         return {"status": "success"}
 
     except Exception as e:
         # Log error but don't fail the request
-        print(f"Error tracking activity: {str(e)}")
+        logger.exception("Error tracking activity")
         return {"status": "error", "message": str(e)}
\ No newline at end of file
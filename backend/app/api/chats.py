@@ -1,16 +1,24 @@
 # backend/app/api/chats.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from bson import ObjectId
-from typing import List, Dict, Any
-from app.core.database import get_database
-from pymongo.database import Database
+from bson.errors import InvalidId
+from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timezone
+from pydantic import BaseModel
+from app.core import database
+from app.utils.cache import CacheManager
 
 # Imports for secure token verification
 from google.oauth2 import id_token
 from google.auth.transport import requests
 import os # Recommended for handling environment variables
+import orjson
 
 router = APIRouter(prefix="/api/chats", tags=["chats"])
 security = HTTPBearer()
@@ -18,6 +26,29 @@ security = HTTPBearer()
 # It's best practice to load your Client ID from an environment variable
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID", str)
 
+# Cache verified tokens (keyed by SHA-256 hash, never the raw token) so
+# repeated requests skip the round-trip to Google's servers.
+token_cache = CacheManager(default_ttl=300)
+
+# Shared transport Request so Google's signing keys are fetched once and
+# the underlying HTTP session is reused across verifications.
+google_request = requests.Request()
+
+def _orjson_default(obj):
+    """Teach orjson how to encode the BSON types Mongo hands back."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class SyncChatsRequest(BaseModel):
+    """Body of POST /sync - metadata for the chat being created."""
+    title: str = "New Chat"
+    createdAt: Optional[Any] = None
+
+class UpdateTitleRequest(BaseModel):
+    """Body of PUT /{chat_id}/title."""
+    title: str
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     """
     Securely validates a Google ID token and returns the user's information.
@@ -31,12 +62,25 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached_info = token_cache.get(cache_key)
+    if cached_info is not None:
+        return cached_info
+
     try:
-        # Verify the token with Google's servers
-        id_info = id_token.verify_oauth2_token(
-            token, requests.Request(), GOOGLE_CLIENT_ID
+        # Verify the token with Google's servers. The verify is blocking
+        # (key fetch + RSA check), so run it in the threadpool rather than
+        # stalling the event loop on a cache miss.
+        id_info = await run_in_threadpool(
+            id_token.verify_oauth2_token,
+            token, google_request, GOOGLE_CLIENT_ID
         )
 
+        # Cache until shortly before the token expires (at most 5 minutes)
+        ttl = min(300, int(id_info.get("exp", 0) - time.time()) - 30)
+        if ttl > 0:
+            token_cache.set(cache_key, id_info, ttl=ttl)
+
         # 'sub' is Google's unique ID for the user.
         return id_info
 
@@ -57,8 +101,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
 
 @router.post("/sync")
 async def sync_chats(
-    chat_data: Dict[str, Any],
-    db: Database = Depends(get_database),
+    chat_data: SyncChatsRequest,
     user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -66,36 +109,26 @@ async def sync_chats(
     """
     try:
         user_google_id = user.get("sub")
-        chats_collection = db.get_collection("chats")
 
         # 1. Create a new chat
-        new_chat = await chats_collection.insert_one({
+        new_chat = await database.chats_coll.insert_one({
             "userId": user_google_id,
-            "title": chat_data.get("title", "New Chat"),
+            "title": chat_data.title,
             "history": [],
-            "createdAt": chat_data.get("createdAt")
+            "createdAt": chat_data.createdAt
         })
 
-        # 2. Get all chats
-        chats_cursor = chats_collection.find({"userId": user_google_id})
+        # 2. Get all chats and collect their histories in the same pass,
+        # avoiding a second round-trip per chat
+        chats_cursor = database.chats_coll.find({"userId": user_google_id})
         chats = []
-        chat_ids = []
+        histories = {}
         async for chat in chats_cursor:
             chat_id = str(chat["_id"])
             chat["_id"] = chat_id
-            chat_ids.append(chat_id)
+            histories[chat_id] = chat.get("history", [])
             chats.append(chat)
 
-        # 3. Get histories for each chat
-        histories = {}
-        for chat_id in chat_ids:
-            chat_doc = await chats_collection.find_one({
-                "_id": ObjectId(chat_id),
-                "userId": user_google_id
-            })
-            if chat_doc:
-                histories[chat_id] = chat_doc.get("history", [])
-
         return {
             "status": "success",
             "newChatId": str(new_chat.inserted_id),
@@ -106,9 +139,115 @@ async def sync_chats(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
+@router.get("/{chat_id}/history")
+async def get_chat_history(
+    chat_id: str,
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Get the full message history for a single chat.
+    """
+    # Reject malformed ids with a 400 before spending a round-trip on Mongo
+    try:
+        chat_oid = ObjectId(chat_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid chat id")
+
+    try:
+        user_google_id = user.get("sub")
+
+        # Only the history field is needed, so project everything else out
+        # and let Mongo skip decoding the rest of the document
+        chat = await database.chats_coll.find_one(
+            {"_id": chat_oid, "userId": user_google_id},
+            projection={"history": 1}
+        )
+        if not chat:
+            raise HTTPException(status_code=404, detail="Chat not found")
+
+        return {"status": "success", "history": chat.get("history", [])}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.put("/{chat_id}/title")
+async def update_chat_title(
+    chat_id: str,
+    body: UpdateTitleRequest,
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Rename a chat belonging to the current user.
+    """
+    try:
+        chat_oid = ObjectId(chat_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid chat id")
+
+    try:
+        user_google_id = user.get("sub")
+
+        # A single targeted update - no read-modify-write round-trip, and
+        # matched_count distinguishes a missing chat from a no-op rename
+        result = await database.chats_coll.update_one(
+            {"_id": chat_oid, "userId": user_google_id},
+            {"$set": {"title": body.title}}
+        )
+        if result.matched_count == 0:
+            raise HTTPException(status_code=404, detail="Chat not found")
+
+        return {"status": "success", "message": "Chat title updated"}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.delete("/{chat_id}")
+async def delete_chat(
+    chat_id: str,
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Delete a chat belonging to the current user.
+    """
+    try:
+        chat_oid = ObjectId(chat_id)
+    except InvalidId:
+        raise HTTPException(status_code=400, detail="Invalid chat id")
+
+    try:
+        user_google_id = user.get("sub")
+
+        # The chat delete and the activity log are independent writes, so
+        # run them concurrently instead of paying two sequential round-trips
+        delete_result, _ = await asyncio.gather(
+            database.chats_coll.delete_one({
+                "_id": chat_oid,
+                "userId": user_google_id
+            }),
+            database.activities_coll.insert_one({
+                "userId": user_google_id,
+                "timestamp": datetime.now(timezone.utc),
+                "type": "chat_deleted",
+                "details": {"chatId": chat_id}
+            })
+        )
+
+        if delete_result.deleted_count == 0:
+            raise HTTPException(status_code=404, detail="Chat not found")
+
+        return {"status": "success", "message": "Chat deleted successfully"}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("")
 async def get_chats(
-    db: Database = Depends(get_database),
     user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -116,15 +255,22 @@ async def get_chats(
     """
     try:
         user_google_id = user.get("sub")
-        chats_collection = db.get_collection("chats")
 
-        chats_cursor = chats_collection.find({"userId": user_google_id})
-        chats = []
-        async for chat in chats_cursor:
-            chat["_id"] = str(chat["_id"])
-            chats.append(chat)
+        # Project out the (potentially large) history blobs - the list view
+        # only needs chat metadata - and pull the documents in large batches
+        # instead of awaiting the cursor once per document
+        cursor = database.chats_coll.find(
+            {"userId": user_google_id},
+            projection={"history": 0}
+        ).batch_size(500)
+        chats = await cursor.to_list(length=1000)
 
-        return {"status": "success", "chats": chats}
+        # Serialize straight from the BSON documents: orjson stringifies the
+        # ObjectIds via the default hook, so no per-document mutation loop
+        return Response(
+            orjson.dumps({"status": "success", "chats": chats}, default=_orjson_default),
+            media_type="application/json"
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
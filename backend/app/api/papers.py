@@ -1,8 +1,12 @@
 # backend/app/api/papers.py
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Any
+import hashlib
+import time
+from app.utils.cache import CacheManager
 
 # Imports for secure token verification
 from google.oauth2 import id_token
@@ -15,6 +19,14 @@ security = HTTPBearer()
 # It's best practice to load your Client ID from an environment variable
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID", str)
 
+# Cache verified tokens (keyed by SHA-256 hash, never the raw token) so
+# repeated requests skip the round-trip to Google's servers.
+token_cache = CacheManager(default_ttl=300)
+
+# Reuse a single transport Request so the underlying HTTP session (and the
+# Google signing keys it caches) are shared across verifications.
+google_request = requests.Request()
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     """
     Securely validates a Google ID token and returns the user's information.
@@ -28,12 +40,26 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached_info = token_cache.get(cache_key)
+    if cached_info is not None:
+        return cached_info
+
     try:
-        # Verify the token with Google's servers
-        id_info = id_token.verify_oauth2_token(
-            token, requests.Request(), GOOGLE_CLIENT_ID
+        # Verify the token with Google's servers. The verify call does a
+        # blocking HTTPS fetch of Google's signing keys plus a synchronous
+        # RSA check, so run it in the threadpool instead of stalling the
+        # event loop for every authenticated request.
+        id_info = await run_in_threadpool(
+            id_token.verify_oauth2_token,
+            token, google_request, GOOGLE_CLIENT_ID
         )
 
+        # Cache until shortly before the token expires (at most 5 minutes)
+        ttl = min(300, int(id_info.get("exp", 0) - time.time()) - 30)
+        if ttl > 0:
+            token_cache.set(cache_key, id_info, ttl=ttl)
+
         # 'sub' is Google's unique ID for the user.
         return id_info
 
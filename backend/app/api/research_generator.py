@@ -1,69 +1,89 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 import asyncio
+import hashlib
+import json
 import logging
-import os
-import shutil
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
 
 from ..services.gemini_generator import GeminiGenerator
 from ..services.github_processor import GitHubProcessor
-from ..services.content_generator import ContentGenerator
+from ..utils.cache import CacheManager
 from ..utils.paper_humanizer import PaperHumanizer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-class ResearchPaperGenerator:
-    """
-    Service to generate research papers from code repositories
-    using the Gemini AI model with enhanced humanization.
-    """
-    def __init__(self):
-        self.gemini_generator = GeminiGenerator()
-        self.github_processor = GitHubProcessor()
-        self.content_generator = ContentGenerator()
-        self.humanizer = PaperHumanizer()
-        
-    async def generate_research_paper(
-        self,
-        topic: str,
-        sections: Optional[List[str]] = None,
-        word_count: int = 3000,
-        repo_url: Optional[str] = None,
-        include_function_details: bool = False
-    ) -> Dict[str, str]:
-        try:
-            logger.info(f"Generating research paper on topic: {topic}")
+# Canonical section order; also the default set when a request doesn't
+# name its sections
+DEFAULT_SECTIONS = (
+    "abstract",
+    "introduction",
+    "literature_review",
+    "methodology",
+    "results",
+    "discussion",
+    "conclusion",
+    "references"
+)
 
-            if not sections:
-                sections = [
-                    "abstract",
-                    "introduction",
-                    "literature_review",
-                    "methodology",
-                    "results",
-                    "discussion",
-                    "conclusion",
-                    "references"
-                ]
-            sections = [section.lower() for section in sections]
-            if "code_analysis" in sections:
-                sections.remove("code_analysis")
+# Section names that must never be generated - frozenset so membership
+# checks hash instead of scanning a per-iteration list literal
+EXCLUDED_SECTIONS = frozenset({"code_analysis", "code analysis", "implementation"})
 
-            result = {}
+# Display names precomputed once instead of re-capitalizing per section
+# in every formatting pass
+PRETTY_SECTION_NAMES = {
+    section: ' '.join(word.capitalize() for word in section.split('_'))
+    for section in DEFAULT_SECTIONS
+}
 
-            if repo_url:
-                logger.info(f"Analyzing GitHub repository: {repo_url}")
-                repo_path = await self.github_processor.clone_repository(repo_url)
-                try:
-                    code_files = await self.github_processor.read_repository_files(repo_path)
-                    repo_metadata = await self.github_processor.get_repository_metadata(repo_url)
-                    code_chunks = await self.gemini_generator.divide_code_into_chunks(code_files)
+@lru_cache(maxsize=256)
+def _parse_repo_url(url: str) -> tuple:
+    """Split a repo URL into (owner, name). Memoized - users typically
+    iterate on the same few repos."""
+    parts = url.rstrip('/').split('/')
+    owner = parts[-2] if len(parts) >= 2 else "Unknown"
+    name = parts[-1] if len(parts) >= 1 else "Unknown"
+    return owner, name
+
+def _pretty_section(section: str) -> str:
+    """Human-readable form of a section key, precomputed for the standard set."""
+    name = PRETTY_SECTION_NAMES.get(section)
+    if name is None:
+        name = ' '.join(word.capitalize() for word in section.split('_'))
+    return name
 
-                    if include_function_details:
-                        system_prompt = """
+# IEEE-style section numbering for the body sections
+SECTION_NUMBERS = {
+    "abstract": "0",
+    "introduction": "I",
+    "literature_review": "II",
+    "methodology": "III",
+    "results": "IV",
+    "discussion": "V",
+    "conclusion": "VI",
+    "references": ""
+}
+
+# Fully rendered markdown headers, one dict lookup per section at paper
+# assembly time instead of a split/capitalize/join round per request
+SECTION_HEADERS = {
+    section: (
+        f"## {PRETTY_SECTION_NAMES[section]}\n\n"
+        if section in ("abstract", "references")
+        else f"## {SECTION_NUMBERS[section]}. {PRETTY_SECTION_NAMES[section]}\n\n"
+    )
+    for section in DEFAULT_SECTIONS
+}
+
+# Repo-mode system prompts, keyed by include_function_details
+REPO_SYSTEM_PROMPTS = {
+    True: """
 You are generating a technical research paper based on a software repository.
 
 IMPORTANT INSTRUCTIONS:
@@ -75,9 +95,8 @@ IMPORTANT INSTRUCTIONS:
 6. Where relevant, include a table listing function names, parameters, and a one-line description.
 7. Write in a natural, human-like manner that flows well and sounds professional.
 8. Use varied sentence structures and avoid repetitive patterns.
-"""
-                    else:
-                        system_prompt = """
+""",
+    False: """
 You are generating a formal IEEE-style academic research paper based on a software repository.
 
 EXTREMELY IMPORTANT INSTRUCTIONS - You MUST follow these exactly:
@@ -90,26 +109,55 @@ EXTREMELY IMPORTANT INSTRUCTIONS - You MUST follow these exactly:
 7. Write in a natural, human-like academic style that flows well
 8. Use varied sentence structures and avoid repetitive or robotic patterns
 9. Include thoughtful insights and analysis rather than just descriptions
+""",
+}
+
+REFS_SYSTEM_PROMPT = ("You are a bibliography generator for IEEE papers. "
+                      "You create proper IEEE format references with natural academic formatting.")
+
+REFS_INSTRUCTION = """
+Generate the references section for an IEEE research paper about software architecture and engineering.
+Format the references in proper IEEE format.
+Include the GitHub repository as the first reference. Then include relevant software engineering references.
+DO NOT make up fake citations - use only legitimate, well-known software engineering books and papers.
+Write the references in a natural, proper academic format.
 """
 
-                    for section in sections:
-                        if section in ["code_analysis", "code analysis", "implementation"]:
-                            continue
+TOPIC_SYSTEM_PROMPT = """
+You are a research paper generator that creates comprehensive, well-structured academic papers.
+Your writing should sound natural and human-like, with:
+- Varied sentence structures and lengths
+- Smooth transitions between paragraphs
+- Thoughtful analysis and insights
+- Professional yet accessible language
+- Proper academic tone without being robotic
+Write in IEEE format with proper structure and flow.
+"""
 
-                        # Generate base content
-                        if include_function_details:
-                            section_instruction = f"""
-Generate the {section} section for a technical research paper about the repository.
+# Topic-only user prompts as module-level templates: the constant text is
+# parsed once and per-request work is a single .format call
+TOPIC_SECTION_TMPL = """
+Generate the {section} section for a research paper on the topic: {topic}.
+This section should be approximately {target_words} words.
+Write in a natural, human-like academic style with:
+- Varied sentence structures
+- Smooth transitions between ideas
+- Professional yet engaging tone
+- Thoughtful insights and analysis
+- Proper academic vocabulary without being overly complex
+Focus on {topic} and ensure the content is relevant and well-structured.
+"""
 
-- You MAY include function names and summaries.
-- Provide tables or lists of important functions with their purposes and parameters.
-- DO NOT include raw code snippets.
-- Focus on code structure, architecture, and key components.
-- Write naturally and professionally, as if a human academic wrote this.
-- Use varied sentence structures and smooth transitions between ideas.
+TOPIC_REFS_TMPL = """
+Generate the references section for a research paper on the topic: {topic}.
+Include legitimate academic references in proper IEEE format.
+Ensure the references are relevant to {topic} and properly formatted.
+Write them naturally as they would appear in a professional academic paper.
 """
-                        else:
-                            section_instruction = f"""
+
+# Per-section repo-paper instructions, rendered once at import time so
+# request handling doesn't rebuild the same strings for every section
+_REPO_SECTION_TMPL = """
 Generate the {section} section for an IEEE research paper about the repository.
 
 EXTREMELY IMPORTANT:
@@ -122,7 +170,143 @@ EXTREMELY IMPORTANT:
 - Ensure smooth flow and proper transitions between ideas
 """
 
-                        repo_info = f"""
+_REPO_FUNCTION_TMPL = """
+Generate the {section} section for a technical research paper about the repository.
+
+- You MAY include function names and summaries.
+- Provide tables or lists of important functions with their purposes and parameters.
+- DO NOT include raw code snippets.
+- Focus on code structure, architecture, and key components.
+- Write naturally and professionally, as if a human academic wrote this.
+- Use varied sentence structures and smooth transitions between ideas.
+"""
+
+REPO_SECTION_INSTRUCTIONS = {
+    section: _REPO_SECTION_TMPL.format(section=section) for section in DEFAULT_SECTIONS
+}
+REPO_FUNCTION_INSTRUCTIONS = {
+    section: _REPO_FUNCTION_TMPL.format(section=section) for section in DEFAULT_SECTIONS
+}
+
+# In-flight Gemini calls are capped by a semaphore inside
+# GeminiGenerator itself, so call sites here don't wrap their own.
+
+# Finished papers keyed by their request fingerprint - a repeat submission
+# costs a dict lookup instead of a clone plus many seconds of Gemini calls.
+# Entries are full formatted papers (multi-MB), so the cap is kept small:
+# at ~64 papers the least recently used is evicted well before the 24h TTL.
+paper_cache = CacheManager(default_ttl=86400, maxsize=64)
+
+# Per-key locks so concurrent identical requests coalesce into a single
+# generation instead of stampeding Gemini
+_paper_locks: Dict[str, asyncio.Lock] = {}
+
+class GeneratePaperRequest(BaseModel):
+    """Body of the generate-paper endpoints - validated by pydantic-core
+    in a single pass instead of hand-rolled dict lookups."""
+    # Ignore unknown fields instead of erroring, so older/newer frontends
+    # can keep posting extra keys
+    model_config = ConfigDict(populate_by_name=True, extra='ignore')
+
+    topic: str
+    sections: List[str] = []
+    wordCount: int = 3000
+    repoUrl: Optional[str] = None
+    sourceUrl: Optional[str] = None
+    sourceType: Optional[str] = None
+    includeFunctionDetails: bool = False
+    humanize: bool = True
+
+class ResearchPaperGenerator:
+    """
+    Service to generate research papers from code repositories
+    using the Gemini AI model with enhanced humanization.
+    """
+    def __init__(self):
+        self.gemini_generator = GeminiGenerator()
+        self.github_processor = GitHubProcessor()
+        self.humanizer = PaperHumanizer()
+        
+    async def generate_research_paper(
+        self,
+        topic: str,
+        sections: Optional[List[str]] = None,
+        word_count: int = 3000,
+        repo_url: Optional[str] = None,
+        include_function_details: bool = False,
+        humanize: bool = True
+    ) -> Dict[str, str]:
+        if not sections:
+            sections = DEFAULT_SECTIONS
+        # Lowercase and drop excluded names in one pass
+        sections = [s for s in (section.lower() for section in sections)
+                    if s not in EXCLUDED_SECTIONS]
+
+        # Key the cache on the request inputs plus the repo's current
+        # commit, so a push to the repo invalidates its cached papers
+        repo_sha = None
+        if repo_url:
+            try:
+                repo_sha = await self.github_processor.get_latest_commit_sha(repo_url)
+            except Exception as e:
+                logger.warning(f"Could not resolve repo commit SHA: {str(e)}")
+
+        cache_key = hashlib.sha256(json.dumps(
+            [topic, sorted(sections), word_count, repo_url, repo_sha,
+             include_function_details, humanize]
+        ).encode()).hexdigest()
+
+        cached = paper_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Returning cached paper for topic: {topic}")
+            return cached
+
+        lock = _paper_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                # A concurrent identical request may have finished while we
+                # waited on the lock
+                cached = paper_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                formatted_result = await self._generate_research_paper(
+                    topic, sections, word_count, repo_url, include_function_details,
+                    humanize
+                )
+                paper_cache.set(cache_key, formatted_result)
+                return formatted_result
+        finally:
+            _paper_locks.pop(cache_key, None)
+
+    async def _generate_research_paper(
+        self,
+        topic: str,
+        sections: List[str],
+        word_count: int,
+        repo_url: Optional[str],
+        include_function_details: bool,
+        humanize: bool = True
+    ) -> Dict[str, str]:
+        try:
+            logger.info(f"Generating research paper on topic: {topic}")
+
+            result = {}
+
+            if repo_url:
+                logger.info(f"Analyzing GitHub repository: {repo_url}")
+                # The section prompts consume only the repo metadata, and
+                # the cache key's commit SHA comes from the API as well -
+                # downloading and extracting the whole tree per request was
+                # O(repo size) IO with no consumer, so nothing is fetched
+                repo_metadata = await self.github_processor.get_repository_metadata(repo_url)
+                cached_context = None
+                try:
+
+                    system_prompt = REPO_SYSTEM_PROMPTS[include_function_details]
+
+                    # repo_info is the same for every section, so build it once
+                    repo_info = f"""
 Repository Name: {repo_metadata.get('name', 'Unknown')}
 Repository Owner: {repo_metadata.get('owner', 'Unknown')}
 Description: {repo_metadata.get('description', 'No description')}
@@ -132,83 +316,159 @@ Created: {repo_metadata.get('created_at', 'Unknown')}
 Last Updated: {repo_metadata.get('updated_at', 'Unknown')}
 """
 
+                    # The system prompt + repo metadata are identical for every
+                    # section call, so cache them server-side once and let each
+                    # call pay only for its section-specific delta. Falls back
+                    # to inline prompts when caching isn't available.
+                    cached_context = await self.gemini_generator.create_context_cache(
+                        system_prompt, f"Repository Metadata:\n{repo_info}"
+                    )
+
+                    # The metadata suffix is invariant across sections; build
+                    # it once (it's only sent inline when the server-side
+                    # context cache is unavailable)
+                    metadata_block = f"\n\nRepository Metadata:\n{repo_info}"
+
+                    async def generate_section(section: str) -> str:
                         if section == "references":
-                            refs_instruction = """
-Generate the references section for an IEEE research paper about software architecture and engineering.
-Format the references in proper IEEE format.
-Include the GitHub repository as the first reference. Then include relevant software engineering references.
-DO NOT make up fake citations - use only legitimate, well-known software engineering books and papers.
-Write the references in a natural, proper academic format.
-"""
                             base_content = await self.gemini_generator._generate_with_gemini(
-                                "You are a bibliography generator for IEEE papers. You create proper IEEE format references with natural academic formatting.",
-                                f"{refs_instruction}\n\nRepository: {repo_url}\nNo code snippets allowed."
+                                REFS_SYSTEM_PROMPT,
+                                f"{REFS_INSTRUCTION}\n\nRepository: {repo_url}\nNo code snippets allowed."
                             )
                         else:
+                            if include_function_details:
+                                instructions, template = REPO_FUNCTION_INSTRUCTIONS, _REPO_FUNCTION_TMPL
+                            else:
+                                instructions, template = REPO_SECTION_INSTRUCTIONS, _REPO_SECTION_TMPL
+                            section_instruction = instructions.get(section)
+                            if section_instruction is None:
+                                # Non-standard section names fall back to a
+                                # one-off render
+                                section_instruction = template.format(section=section)
+
+                            if cached_context is not None:
+                                prompt = section_instruction
+                            else:
+                                prompt = section_instruction + metadata_block
                             base_content = await self.gemini_generator._generate_with_gemini(
-                                system_prompt,
-                                f"{section_instruction}\n\nRepository Metadata:\n{repo_info}"
+                                system_prompt, prompt, cached_content=cached_context
                             )
-                        
-                        # Humanize the content
-                        result[section] = await self.humanizer.humanize_content(base_content, section)
-                        
+
+                        # Humanize the content unless the caller opted out
+                        if not humanize:
+                            return base_content
+                        return await self.humanizer.humanize_content(base_content, section)
+
+                    # Each section is an independent Gemini round-trip, so run
+                    # them concurrently: wall-clock time drops from the sum of
+                    # the section latencies to roughly the slowest one.
+                    # (Excluded names were already filtered out up front.)
+                    section_results = await asyncio.gather(
+                        *(generate_section(s) for s in sections),
+                        return_exceptions=True
+                    )
+                    for section, content in zip(sections, section_results):
+                        if isinstance(content, Exception):
+                            logger.error(f"Error generating {section}: {str(content)}")
+                            result[section] = f"Error generating {section}. Please try again."
+                        else:
+                            result[section] = content
+
                 finally:
-                    if os.path.exists(repo_path):
-                        try:
-                            self.github_processor.safe_rmtree(repo_path)
-                        except Exception as cleanup_error:
-                            logger.warning(f"Failed to clean up temporary directory: {str(cleanup_error)}")
+                    await self.gemini_generator.delete_context_cache(cached_context)
             else:
                 # Topic-only generation with humanization
                 target_words_per_section = max(200, word_count // len(sections))
-                
-                for section in sections:
-                    if section == "references":
-                        combined_prompt = f"""
-Generate the references section for a research paper on the topic: {topic}.
-Include legitimate academic references in proper IEEE format.
-Ensure the references are relevant to {topic} and properly formatted.
-Write them naturally as they would appear in a professional academic paper.
-"""
-                    else:
-                        combined_prompt = f"""
-Generate the {section} section for a research paper on the topic: {topic}.
-This section should be approximately {target_words_per_section} words.
-Write in a natural, human-like academic style with:
-- Varied sentence structures
-- Smooth transitions between ideas
-- Professional yet engaging tone
-- Thoughtful insights and analysis
-- Proper academic vocabulary without being overly complex
-Focus on {topic} and ensure the content is relevant and well-structured.
-"""
-
-                    system_prompt = """
-You are a research paper generator that creates comprehensive, well-structured academic papers.
-Your writing should sound natural and human-like, with:
-- Varied sentence structures and lengths
-- Smooth transitions between paragraphs
-- Thoughtful analysis and insights
-- Professional yet accessible language
-- Proper academic tone without being robotic
-Write in IEEE format with proper structure and flow.
-"""
 
+                # First try row-marshaling: one structured Gemini call that
+                # returns every body section, amortizing the shared prompt
+                # prefix and spending one rate-limit slot instead of eight.
+                # Long papers skip it - a single response would hit output
+                # limits - and any parse problem falls back to per-section
+                # calls.
+                marshaled = None
+                if word_count <= 5000:
                     try:
-                        base_content = await self.gemini_generator._generate_with_gemini(system_prompt, combined_prompt)
-                        result[section] = await self.humanizer.humanize_content(base_content, section)
+                        marshaled = await self._generate_topic_sections_marshaled(
+                            topic, sections, target_words_per_section
+                        )
                     except Exception as e:
-                        logger.error(f"Error generating {section}: {str(e)}")
-                        result[section] = f"Error generating {section}. Please try again."
+                        logger.warning(f"Marshaled generation failed, falling back to per-section calls: {str(e)}")
+
+                if marshaled is not None:
+                    if humanize:
+                        humanized = await asyncio.gather(
+                            *(self.humanizer.humanize_content(marshaled[section], section)
+                              for section in marshaled),
+                            return_exceptions=True
+                        )
+                        for section, content in zip(marshaled, humanized):
+                            result[section] = marshaled[section] if isinstance(content, Exception) else content
+                    else:
+                        result.update(marshaled)
+
+                    # References keeps its own call - its instructions differ
+                    # from the body sections
+                    if "references" in sections:
+                        try:
+                            system_prompt, combined_prompt = self._topic_prompts(
+                                topic, "references", target_words_per_section
+                            )
+                            base_content = await self.gemini_generator._generate_with_gemini(
+                                system_prompt, combined_prompt
+                            )
+                            if humanize:
+                                base_content = await self.humanizer.humanize_content(base_content, "references")
+                            result["references"] = base_content
+                        except Exception as e:
+                            logger.error(f"Error generating references: {str(e)}")
+                            result["references"] = "Error generating references. Please try again."
+
+                else:
+                    async def _gen_section(section: str) -> str:
+                        system_prompt, combined_prompt = self._topic_prompts(
+                            topic, section, target_words_per_section
+                        )
+                        if humanize:
+                            try:
+                                # Pipeline the two stages: humanize completed
+                                # paragraphs while Gemini is still streaming
+                                # the rest of the section
+                                return await self.humanizer.humanize_content_stream(
+                                    self.gemini_generator._generate_with_gemini_stream(
+                                        system_prompt, combined_prompt
+                                    ),
+                                    section
+                                )
+                            except Exception as e:
+                                logger.warning(f"Streaming generation failed for {section}, using buffered path: {str(e)}")
+
+                        base_content = await self.gemini_generator._generate_with_gemini(
+                            system_prompt, combined_prompt
+                        )
+                        if not humanize:
+                            return base_content
+                        return await self.humanizer.humanize_content(base_content, section)
+
+                    # Sections are independent Gemini round-trips, so fan them
+                    # out just like the repo branch does
+                    section_results = await asyncio.gather(
+                        *(_gen_section(section) for section in sections),
+                        return_exceptions=True
+                    )
+                    for section, content in zip(sections, section_results):
+                        if isinstance(content, Exception):
+                            logger.error(f"Error generating {section}: {str(content)}")
+                            result[section] = f"Error generating {section}. Please try again."
+                        else:
+                            result[section] = content
 
             # Format and structure the final paper
             formatted_result = {}
-            section_order = ["abstract", "introduction", "literature_review", "methodology",
-                             "results", "discussion", "conclusion", "references"]
+            section_order = DEFAULT_SECTIONS
 
             for section in section_order:
-                formatted_section = ' '.join(word.capitalize() for word in section.split('_'))
+                formatted_section = _pretty_section(section)
                 formatted_result[formatted_section] = result.get(section, f"This {formatted_section} section was not generated.")
 
             # Create IEEE-style header with better formatting
@@ -225,105 +485,187 @@ Write in IEEE format with proper structure and flow.
             logger.error(f"Error generating research paper: {str(e)}\n{traceback.format_exc()}")
             raise
     
+    async def _generate_topic_sections_marshaled(
+        self, topic: str, sections: List[str], target_words: int
+    ) -> Optional[Dict[str, str]]:
+        """
+        Ask Gemini for every body section in one structured JSON response.
+
+        Returns {section: text} on success, or None when the response can't
+        be parsed or any section came back empty - callers then fall back
+        to per-section generation. References is excluded because its
+        instructions differ.
+        """
+        body_sections = [s for s in sections if s != "references"]
+        if not body_sections:
+            return None
+
+        keys = ", ".join(f'"{s}"' for s in body_sections)
+        prompt = f"""
+Generate a research paper on the topic: {topic}.
+Return ONLY a JSON object with exactly these keys: {keys}.
+Each value must be the complete text of that section, approximately {target_words} words,
+written in a natural, human-like academic style with varied sentence structures,
+smooth transitions, and thoughtful insights, in IEEE format.
+Do not wrap the JSON in markdown fences and do not add any text outside the JSON object.
+"""
+        response = await self.gemini_generator._generate_with_gemini(TOPIC_SYSTEM_PROMPT, prompt)
+
+        # Tolerate fences or stray prose around the object
+        start = response.find("{")
+        end = response.rfind("}")
+        if start == -1 or end <= start:
+            return None
+        try:
+            data = json.loads(response[start:end + 1])
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        marshaled = {}
+        for section in body_sections:
+            text = data.get(section)
+            if not isinstance(text, str) or not text.strip():
+                return None
+            marshaled[section] = text
+        return marshaled
+
+    def _topic_prompts(self, topic: str, section: str, target_words: int) -> tuple:
+        """Build the (system, user) prompt pair for a topic-only section."""
+        if section == "references":
+            combined_prompt = TOPIC_REFS_TMPL.format(topic=topic)
+        else:
+            combined_prompt = TOPIC_SECTION_TMPL.format(
+                section=section, topic=topic, target_words=target_words
+            )
+
+        return TOPIC_SYSTEM_PROMPT, combined_prompt
+
     def _generate_ieee_header(self, topic: str, repo_url: Optional[str] = None) -> str:
         """Generate a properly formatted IEEE-style header"""
-        header = "## IEEE Conference Paper\n\n"
-        header += f"**Title**: {topic}\n"
-        
+        parts = ["## IEEE Conference Paper\n\n", f"**Title**: {topic}\n"]
+
         if repo_url:
-            parts = repo_url.rstrip('/').split('/')
-            owner = parts[-2] if len(parts) >= 2 else "Unknown"
-            repo_name = parts[-1] if len(parts) >= 1 else "Unknown"
-            header += f"**Repository**: {owner}/{repo_name}\n"
-            header += f"**URL**: {repo_url}\n"
-        
-        header += f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n"
-        header += f"**Authors**: Research Paper Generator v2.0\n\n"
-        
-        return header
+            owner, repo_name = _parse_repo_url(repo_url)
+            parts.append(f"**Repository**: {owner}/{repo_name}\n")
+            parts.append(f"**URL**: {repo_url}\n")
+
+        parts.append(f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n")
+        parts.append("**Authors**: Research Paper Generator v2.0\n\n")
+
+        return "".join(parts)
     
     def _construct_full_paper(self, topic: str, header: str, content: Dict[str, str], section_order: List[str]) -> str:
         """Construct the full paper with proper formatting and structure"""
-        full_paper = f"# {topic}\n\n"
-        full_paper += header
-        
+        # Collect parts and join once at the end - repeated += on a string
+        # recopies the whole paper each time, which is quadratic for
+        # multi-megabyte papers
+        parts = [f"# {topic}\n\n", header]
+
         # Add table of contents
-        full_paper += "## Table of Contents\n\n"
+        parts.append("## Table of Contents\n\n")
         for i, section in enumerate(section_order, 1):
-            formatted_section = ' '.join(word.capitalize() for word in section.split('_'))
-            full_paper += f"{i}. {formatted_section}\n"
-        full_paper += "\n---\n\n"
-        
-        # Add sections with proper numbering
-        section_numbers = {
-            "abstract": "0",
-            "introduction": "I",
-            "literature_review": "II",
-            "methodology": "III",
-            "results": "IV",
-            "discussion": "V",
-            "conclusion": "VI",
-            "references": ""
-        }
-        
+            parts.append(f"{i}. {_pretty_section(section)}\n")
+        parts.append("\n---\n\n")
+
+        # Add sections with proper numbering (headers precomputed at import)
         for section in section_order:
-            formatted_section = ' '.join(word.capitalize() for word in section.split('_'))
-            
-            if section == "abstract":
-                full_paper += f"## Abstract\n\n"
-            elif section == "references":
-                full_paper += f"## References\n\n"
-            else:
-                full_paper += f"## {section_numbers[section]}. {formatted_section}\n\n"
-            
+            formatted_section = _pretty_section(section)
+
+            header_line = SECTION_HEADERS.get(section)
+            if header_line is None:
+                header_line = f"## {SECTION_NUMBERS.get(section, '')}. {formatted_section}\n\n"
+            parts.append(header_line)
+
             content_text = content.get(section, f"This {formatted_section} section was not generated.")
-            
+
             # Add some formatting improvements
             if section == "references":
                 # Format references with proper numbering
-                refs = content_text.split('\n')
-                formatted_refs = []
-                for i, ref in enumerate(refs, 1):
-                    if ref.strip() and not ref.startswith('['):
-                        formatted_refs.append(f"[{i}] {ref.strip()}")
-                    elif ref.strip():
-                        formatted_refs.append(ref)
-                full_paper += '\n'.join(formatted_refs)
+                formatted_refs = [
+                    f"[{i}] {ref.strip()}" if not ref.startswith('[') else ref
+                    for i, ref in enumerate(content_text.split('\n'), 1)
+                    if ref.strip()
+                ]
+                parts.append('\n'.join(formatted_refs))
             else:
-                full_paper += content_text
-            
-            full_paper += "\n\n"
-        
+                parts.append(content_text)
+
+            parts.append("\n\n")
+
         # Add footer
-        full_paper += "---\n\n"
-        full_paper += "*This paper was generated using advanced AI technology for research and educational purposes.*\n"
-        
-        return full_paper
-
-generator = ResearchPaperGenerator()
-
-@router.post("/generate-paper")
-async def generate_research_paper(request_data: dict):
-    try:
-        topic = request_data.get("topic")
-        sections = request_data.get("sections", [])
-        word_count = request_data.get("wordCount", 3000)
-        repo_url = request_data.get("repoUrl")
-        if not repo_url and request_data.get("sourceType") == "github":
-            repo_url = request_data.get("sourceUrl")
-        include_function_details = request_data.get("includeFunctionDetails", False)
-
-        if not topic:
-            raise HTTPException(status_code=400, detail="Topic is required")
-
-        paper = await generator.generate_research_paper(
-            topic=topic,
-            sections=sections,
-            word_count=word_count,
-            repo_url=repo_url,
-            include_function_details=include_function_details
-        )
-        return {"paper": paper}
-    except Exception as e:
-        logger.error(f"Error in generate_research_paper endpoint: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        parts.append("---\n\n")
+        parts.append("*This paper was generated using advanced AI technology for research and educational purposes.*\n")
+
+        return "".join(parts)
+
+@lru_cache(maxsize=1)
+def get_generator() -> ResearchPaperGenerator:
+    """
+    Process-wide ResearchPaperGenerator. Built on first use so importing
+    this module stays cheap, and shared everywhere so the app holds one
+    set of Gemini/GitHub clients (and their connection pools) instead of
+    one per caller.
+    """
+    return ResearchPaperGenerator()
+
+@router.post("/generate-paper/stream")
+async def generate_research_paper_stream(
+    body: GeneratePaperRequest,
+    generator: ResearchPaperGenerator = Depends(get_generator),
+):
+    """
+    Stream topic-paper sections as newline-delimited JSON events while
+    Gemini is still producing them, so the client can render the abstract
+    before the references exist. Events look like
+    {"section": "abstract", "delta": "..."} with a final
+    {"section": ..., "done": true} (or "error") per section, and one
+    closing {"section": "full_paper", "content": ...} with the assembled
+    document.
+
+    Post-hoc humanization needs the complete section text, so this path
+    streams the raw Gemini output.
+    """
+    topic = body.topic
+    sections = [section.lower() for section in (body.sections or DEFAULT_SECTIONS)]
+    target_words = max(200, body.wordCount // len(sections))
+
+    async def stream():
+        queue: asyncio.Queue = asyncio.Queue()
+        results: Dict[str, str] = {}
+
+        async def produce(section: str):
+            parts = []
+            try:
+                system_prompt, combined_prompt = generator._topic_prompts(topic, section, target_words)
+                async for delta in generator.gemini_generator._generate_with_gemini_stream(
+                    system_prompt, combined_prompt
+                ):
+                    parts.append(delta)
+                    await queue.put({"section": section, "delta": delta})
+                results[section] = "".join(parts)
+                await queue.put({"section": section, "done": True})
+            except Exception as e:
+                logger.error(f"Error streaming {section}: {str(e)}")
+                await queue.put({"section": section, "error": str(e)})
+
+        producers = [asyncio.create_task(produce(section)) for section in sections]
+        try:
+            finished = 0
+            while finished < len(sections):
+                event = await queue.get()
+                if "done" in event or "error" in event:
+                    finished += 1
+                yield json.dumps(event) + "\n"
+
+            # All sections have settled - close with the assembled paper so
+            # clients don't have to reimplement the formatting themselves
+            header = generator._generate_ieee_header(topic)
+            full_paper = generator._construct_full_paper(topic, header, results, sections)
+            yield json.dumps({"section": "full_paper", "content": full_paper}) + "\n"
+        finally:
+            for task in producers:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
\ No newline at end of file
@@ -1,30 +1,56 @@
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 
-class Settings(BaseSettings):
-    # API settings
-    API_PREFIX: str = "/api"
-    
+from dotenv import load_dotenv
+
+# Settings come from the environment (and .env) and never change at
+# runtime, so they're read once into a frozen slots dataclass: attribute
+# access on hot paths is a C-level slot read instead of pydantic's
+# validation machinery.
+load_dotenv()
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     # MongoDB settings
     MONGODB_USERNAME: str
     MONGODB_PASSWORD: str
     MONGODB_CLUSTER: str
     MONGODB_DB_NAME: str
-    MONGODB_URL: str # Add this line to allow the mongodb_url field
-    
+    MONGODB_URL: str
+
     # Redis settings
     REDIS_URL: str
-    
+
     # Gemini API settings
     GEMINI_API_KEY: str
-    GEMINI_MODEL_NAME: str = "gemini-2.0-flash"
 
     # Google API settings
     GOOGLE_API_KEY: str
-    
+
     # GitHub settings
     GITHUB_TOKEN: str
-    
-    class Config:
-        env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+    # API settings
+    API_PREFIX: str = "/api"
+    GEMINI_MODEL_NAME: str = "gemini-2.0-flash"
+    GEMINI_MAX_CONCURRENCY: int = 8
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings(
+        MONGODB_USERNAME=os.environ["MONGODB_USERNAME"],
+        MONGODB_PASSWORD=os.environ["MONGODB_PASSWORD"],
+        MONGODB_CLUSTER=os.environ["MONGODB_CLUSTER"],
+        MONGODB_DB_NAME=os.environ["MONGODB_DB_NAME"],
+        MONGODB_URL=os.environ["MONGODB_URL"],
+        REDIS_URL=os.environ["REDIS_URL"],
+        GEMINI_API_KEY=os.environ["GEMINI_API_KEY"],
+        GOOGLE_API_KEY=os.environ["GOOGLE_API_KEY"],
+        GITHUB_TOKEN=os.environ["GITHUB_TOKEN"],
+        API_PREFIX=os.environ.get("API_PREFIX", "/api"),
+        GEMINI_MODEL_NAME=os.environ.get("GEMINI_MODEL_NAME", "gemini-2.0-flash"),
+        GEMINI_MAX_CONCURRENCY=int(os.environ.get("GEMINI_MAX_CONCURRENCY", "8")),
+    )
+
+settings = get_settings()
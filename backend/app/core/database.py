@@ -12,28 +12,64 @@ MONGODB_PASSWORD = os.getenv("MONGODB_PASSWORD", "LemonLaw@1")
 MONGODB_HOST = os.getenv("MONGODB_HOST", "academai.gxn18.mongodb.net")
 MONGODB_DATABASE = os.getenv("MONGODB_DATABASE", "academai")
 
+# Connection URL built once at import
+_username = quote_plus(MONGODB_USERNAME)
+_password = quote_plus(MONGODB_PASSWORD)
+_mongo_url = f"mongodb+srv://{_username}:{_password}@{MONGODB_HOST}/?retryWrites=true&w=majority&appName=academai&connectTimeoutMS=10000&socketTimeoutMS=10000"
+
+# One client for the whole process, created at import. The driver opens
+# connections lazily, so this costs nothing until first use, and every
+# caller shares the same pool instead of building a new one per init_db
+# call. The pool is sized and pre-warmed explicitly: minPoolSize keeps
+# TCP+TLS connections open so bursts on /sync and /google-signin don't
+# pay handshake cost, and wire compression shrinks the large
+# chat/history payloads. Unsupported compressors are ignored by the
+# driver, so zlib acts as the always-available fallback.
+client = motor.motor_asyncio.AsyncIOMotorClient(
+    _mongo_url,
+    maxPoolSize=200,
+    minPoolSize=20,
+    maxIdleTimeMS=60_000,
+    waitQueueTimeoutMS=5_000,
+    serverSelectionTimeoutMS=5_000,
+    retryWrites=True,
+    compressors="zstd,snappy,zlib",
+)
+
+# Collection handles cached once at startup so handlers don't rebuild a
+# Collection wrapper (dict lookup + allocation) on every request. Populated
+# by init_db(); access them through the module (e.g. database.users_coll).
+users_coll = None
+sessions_coll = None
+chats_coll = None
+activities_coll = None
+papers_coll = None
+paper_activities_coll = None
+paper_contents_coll = None
+
 async def init_db():
-    """Initialize database connection and return database instance."""
+    """Verify the MongoDB connection and return the database instance."""
     try:
-        # Encode username and password for URL
-        username = quote_plus(MONGODB_USERNAME)
-        password = quote_plus(MONGODB_PASSWORD)
-        
-        # Generate MongoDB connection URL
-        mongo_url = f"mongodb+srv://{username}:{password}@{MONGODB_HOST}/?retryWrites=true&w=majority&appName=academai&connectTimeoutMS=10000&socketTimeoutMS=10000"
-        
-        logger.info(f"Generated MongoDB URL: {mongo_url}")
-        print(f"MongoDB URL: {mongo_url}")
-        
-        # Create client and connect to the database
-        client = motor.motor_asyncio.AsyncIOMotorClient(mongo_url)
-        
-        # Get database instance
+        # Never log the full URL - it embeds the credentials
+        logger.debug("Connecting to MongoDB host %s db %s", MONGODB_HOST, MONGODB_DATABASE)
+
         database = client[MONGODB_DATABASE]
-        
+
         # Ping the database to verify connection
         await database.command("ping")
-        
+
+        # Cache the hot collection handles once instead of calling
+        # db.get_collection(...) in every handler
+        global users_coll, sessions_coll, chats_coll, activities_coll
+        global papers_coll, paper_activities_coll, paper_contents_coll
+        users_coll = database["users"]
+        sessions_coll = database["sessions"]
+        chats_coll = database["chats"]
+        activities_coll = database["user_activities"]
+        papers_coll = database["papers"]
+        paper_activities_coll = database["paper_activities"]
+        paper_contents_coll = database["paper_contents"]
+
         return database
     
     except Exception as e:
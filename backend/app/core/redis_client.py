@@ -0,0 +1,49 @@
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared Redis client, populated by init_redis(). Stays None when Redis
+# is unreachable - callers treat it as an optional cache and fall back
+# to MongoDB, so a missing Redis never takes the API down.
+redis_client: Optional[redis.Redis] = None
+
+_pool: Optional[redis.ConnectionPool] = None
+
+async def init_redis() -> Optional[redis.Redis]:
+    """Connect to Redis through one bounded connection pool.
+
+    Pooled TCP connections avoid a handshake per operation, and the
+    hiredis extra (see requirements.txt) gives C-level reply parsing.
+    """
+    global redis_client, _pool
+    try:
+        _pool = redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=20,
+            socket_timeout=2,
+            socket_connect_timeout=1,
+            decode_responses=True,
+        )
+        client = redis.Redis(connection_pool=_pool)
+        await client.ping()
+        redis_client = client
+        logger.info("Connected to Redis")
+    except Exception as e:
+        logger.warning(f"Redis unavailable, continuing without it: {str(e)}")
+        redis_client = None
+    return redis_client
+
+async def close_redis():
+    """Close the Redis client and drain the pool (call on shutdown)."""
+    global redis_client, _pool
+    if redis_client is not None:
+        await redis_client.close()
+        redis_client = None
+    if _pool is not None:
+        await _pool.disconnect()
+        _pool = None
@@ -3,25 +3,36 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
 import logging
 import uuid
+import zlib
 import jwt
-from datetime import datetime
+from bson import ObjectId
+from datetime import datetime, timezone
+from functools import lru_cache
+from app.core import database
+from app.core import redis_client
 from app.core.database import init_db, get_database
+from app.utils.batcher import AsyncInsertBatcher
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="AcademAI API")
+# orjson serializes large responses (chat lists, generated papers) several
+# times faster than the stdlib json encoder and handles datetimes natively
+app = FastAPI(title="AcademAI API", default_response_class=ORJSONResponse)
 
 # Import all routers
-from app.api.research_generator import router as research_router
+from app.api.research_generator import router as research_router, get_generator
+from app.utils.url_validator import URLValidator
 from app.api.auth import router as auth_router
 from app.api.chats import router as chats_router
 from app.api.papers import router as papers_router
@@ -32,13 +43,17 @@ app.include_router(auth_router)  # Auth router already has /api/auth prefix
 app.include_router(chats_router)  # Chats router already has /api/chats prefix
 app.include_router(papers_router)  # Papers router already has /api/papers prefix
 
-# Add CORS middleware
+# Add CORS middleware. Origins must not carry a trailing slash - the
+# browser's Origin header never does, so the old value matched nothing.
+# Explicit methods/headers plus max_age let browsers cache the preflight
+# and skip the OPTIONS round-trip for 10 minutes.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["https://vakya-pied.vercel.app/"],  # In production, replace with your frontend domain
+    allow_origins=["https://vakya-pied.vercel.app"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=600,
 )
 
 # Initialize database connection
@@ -50,29 +65,51 @@ async def startup_db_client():
     db = await init_db()
     logger.info("Successfully connected to MongoDB database: academai")
     
-    # Create necessary indexes if they don't exist
+    # Create necessary indexes if they don't exist. Each create_index is
+    # an independent server round-trip, so run them concurrently: startup
+    # waits for the slowest one instead of the sum of all of them
     try:
-        # User collection indexes
-        await db.users.create_index("googleId", unique=True)
-        await db.users.create_index("email")
-        
-        # Sessions collection indexes
-        await db.sessions.create_index([("userId", 1), ("active", 1)])
-        
-        # Activities collection indexes
-        await db.user_activities.create_index([("userId", 1), ("timestamp", -1)])
-        
-        # Chats collection indexes
-        await db.chats.create_index([("userId", 1), ("id", 1)])
-        
-        # Paper activities collection indexes
-        await db.paper_activities.create_index([("userId", 1), ("documentId", 1)])
-        await db.paper_activities.create_index([("userId", 1), ("type", 1), ("timestamp", -1)])
-        
+        await asyncio.gather(
+            # User collection indexes
+            db.users.create_index("googleId", unique=True),
+            db.users.create_index("email"),
+
+            # Sessions collection indexes
+            db.sessions.create_index([("userId", 1), ("active", 1)]),
+
+            # Activities collection indexes
+            db.user_activities.create_index([("userId", 1), ("timestamp", -1)]),
+
+            # Chats collection indexes
+            db.chats.create_index([("userId", 1), ("id", 1)]),
+
+            # Paper activities collection indexes. The dashboard query
+            # reads (documentId, topic) per activity; carrying them in the
+            # index keys makes it covering, so matching queries never
+            # fetch the documents themselves
+            db.paper_activities.create_index([("userId", 1), ("documentId", 1)]),
+            db.paper_activities.create_index([
+                ("userId", 1), ("type", 1), ("timestamp", -1),
+                ("documentId", 1), ("topic", 1),
+            ]),
+        )
+
         logger.info("Database indexes created successfully")
     except Exception as e:
         logger.error(f"Error creating database indexes: {str(e)}")
 
+@app.on_event("startup")
+async def startup_redis_client():
+    # Optional cache layer - the API keeps working against Mongo alone
+    await redis_client.init_redis()
+
+@app.on_event("shutdown")
+async def shutdown_clients():
+    # Close the shared GitHub HTTP session and the MongoDB pool
+    await get_generator().github_processor.close()
+    await redis_client.close_redis()
+    database.client.close()
+
 # Define request models
 class PaperRequest(BaseModel):
     topic: str
@@ -80,6 +117,9 @@ class PaperRequest(BaseModel):
     wordCount: int
     sourceType: Optional[str] = None
     sourceUrl: Optional[str] = None
+    # Opting out skips the humanization pass, roughly halving the Gemini
+    # calls per paper
+    humanize: bool = True
 
 # Define response models
 class PaperResponse(BaseModel):
@@ -88,25 +128,102 @@ class PaperResponse(BaseModel):
     message: Optional[str] = None
     paper: Optional[str] = None
 
-# Storage for background tasks
+# Bursts of submissions within a ~10ms window share one insert_many
+# round-trip instead of a Mongo write each
+paper_insert_batcher = AsyncInsertBatcher(lambda: database.papers_coll)
+
+# Storage for background tasks. With Redis up, jobs live in per-document
+# hashes shared by every worker; this dict is the single-process fallback
 paper_jobs = {}
 
+async def _set_job(document_id, **fields):
+    """Record job state in Redis (shared across workers) or in-process."""
+    # Callers pass either the ObjectId or the path string; normalize so
+    # the fallback dict (and the Redis key) use one form
+    document_id = str(document_id)
+    client = redis_client.redis_client
+    if client is not None:
+        try:
+            mapping = {k: (v if v is not None else "") for k, v in fields.items()}
+            await client.hset(f"job:{document_id}", mapping=mapping)
+            await client.expire(f"job:{document_id}", 3600)
+            return
+        except Exception as e:
+            logger.warning(f"Could not write job state to Redis: {str(e)}")
+    job = paper_jobs.setdefault(
+        document_id, {"status": None, "paper": None, "message": None}
+    )
+    job.update(fields)
+
+async def _get_job(document_id):
+    """Fetch job state from Redis or the in-process fallback, or None."""
+    document_id = str(document_id)
+    client = redis_client.redis_client
+    if client is not None:
+        try:
+            fields = await client.hgetall(f"job:{document_id}")
+            if fields:
+                # Empty strings stand in for None in the hash
+                return {k: (v or None) for k, v in fields.items()}
+        except Exception as e:
+            logger.warning(f"Could not read job state from Redis: {str(e)}")
+    return paper_jobs.get(document_id)
+
+async def _cache_paper_status(document_id: str, resp: "PaperResponse"):
+    """Cache a serialized status response in Redis, if Redis is up.
+
+    Status polls arrive every second or two per client; serving them
+    from Redis skips a MongoDB round-trip plus BSON decode. Processing
+    states get a short TTL so transitions show up quickly; terminal
+    states can live longer.
+    """
+    client = redis_client.redis_client
+    if client is None:
+        return
+    try:
+        ttl = 5 if resp.status == "processing" else 300
+        await client.set(f"paper:{document_id}", resp.model_dump_json(), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Could not cache paper status in Redis: {str(e)}")
+
+async def _cached_paper_status(document_id: str):
+    """Return the cached PaperResponse for a document, or None."""
+    client = redis_client.redis_client
+    if client is None:
+        return None
+    try:
+        cached = await client.get(f"paper:{document_id}")
+    except Exception as e:
+        logger.warning(f"Could not read paper status from Redis: {str(e)}")
+        return None
+    if cached is None:
+        return None
+    return PaperResponse.model_validate_json(cached)
+
+@lru_cache(maxsize=4096)
+def _decode_token(token: str):
+    """Decode a bearer token without signature verification.
+
+    SPA clients resend the same token on every call, so the base64 + JSON
+    decode is memoized by token string.
+    """
+    return jwt.decode(token, options={"verify_signature": False})
+
 # Simulate paper generation
-async def generate_paper_content(topic, sections, word_count, source_type=None, source_url=None, user_id=None):
+async def generate_paper_content(topic, sections, word_count, source_type=None, source_url=None, user_id=None, humanize=True):
     """Generate paper content based on the topic and optional source URL."""
     try:
-        # Import the ResearchPaperGenerator from research_generator.py
-        from app.api.research_generator import ResearchPaperGenerator
-        
-        # Create an instance of the research paper generator
-        generator = ResearchPaperGenerator()
-        
+        # Shared process-wide generator - constructing one per call built
+        # fresh Gemini/GitHub clients every time
+        generator = get_generator()
+
         # Generate the paper using the generator
         paper_result = await generator.generate_research_paper(
             topic=topic,
             sections=sections,
             word_count=word_count,
-            repo_url=source_url if source_type == "github" else None
+            repo_url=source_url if source_type == "github" else None,
+            humanize=humanize
         )
         
         # If user is authenticated, track the paper generation
@@ -148,17 +265,17 @@ The introduction would provide background on {topic}.
 async def track_paper_generation(user_id, document_id, topic, sections, word_count, source_type, source_url):
     """Track paper generation in the database"""
     try:
-        if not db:
+        if database.paper_activities_coll is None:
             logger.warning("Database not initialized, skipping paper tracking")
             return
-            
+
         # Store paper generation activity
-        await db.paper_activities.insert_one({
+        await database.paper_activities_coll.insert_one({
             "userId": user_id,
             "documentId": document_id,
             "topic": topic,
             "type": "generation",
-            "timestamp": datetime.now(),
+            "timestamp": datetime.now(timezone.utc),
             "details": {
                 "sections": sections,
                 "wordCount": word_count,
@@ -168,7 +285,7 @@ async def track_paper_generation(user_id, document_id, topic, sections, word_cou
         })
         
         # Update user's papers generated count
-        await db.users.update_one(
+        await database.users_coll.update_one(
             {"googleId": user_id},
             {"$inc": {"papersGenerated": 1}}
         )
@@ -177,83 +294,102 @@ async def track_paper_generation(user_id, document_id, topic, sections, word_cou
         # Don't raise the exception, just log it
 
 # Background task to generate paper
-async def background_paper_generation(document_id, request_data, user_id=None):
+async def background_paper_generation(document_id, request: "PaperRequest", user_id=None):
     try:
-        # Get database collection
-        papers_collection = db.get_collection("papers")
-        
-        # Update status to processing
-        await papers_collection.update_one(
-            {"_id": document_id},
-            {"$set": {"status": "processing", "updated_at": datetime.now()}}
-        )
-        
+        # Collection handle cached at startup (see core.database)
+        papers_collection = database.papers_coll
+
+        # No "processing" write here: the job store already reports
+        # processing to pollers, and the document goes straight from
+        # queued to its terminal state - one Mongo write per job saved
+
         # Generate paper content with source URL if available
         paper_content = await generate_paper_content(
-            request_data["topic"],
-            request_data["sections"],
-            request_data["wordCount"],
-            request_data.get("sourceType"),
-            request_data.get("sourceUrl"),
-            user_id
+            request.topic,
+            request.sections,
+            request.wordCount,
+            request.sourceType,
+            request.sourceUrl,
+            user_id,
+            humanize=request.humanize
         )
         
-        # Update database with completed paper
-        await papers_collection.update_one(
-            {"_id": document_id},
-            {
-                "$set": {
-                    "status": "completed",
-                    "paper_content": paper_content,
-                    "updated_at": datetime.now()
+        # The Mongo write, the job store, and the Redis status cache are
+        # independent targets - run the terminal-state writes concurrently
+        # so the tail latency is the slowest of the three, not the sum
+        # The generated text lives compressed in its own collection so
+        # papers documents stay small and the hot status index pages
+        # aren't evicted from cache by multi-KB blobs
+        compressed = zlib.compress(paper_content.encode("utf-8"))
+        await asyncio.gather(
+            database.paper_contents_coll.replace_one(
+                {"_id": document_id}, {"content_zlib": compressed}, upsert=True
+            ),
+            papers_collection.update_one(
+                {"_id": document_id},
+                {
+                    "$set": {
+                        "status": "completed",
+                        "updated_at": datetime.now(timezone.utc)
+                    }
                 }
-            }
+            ),
+            _set_job(document_id, status="success", paper=paper_content),
+            # Refresh the Redis status cache so polls on other workers
+            # see the terminal state without touching Mongo
+            _cache_paper_status(
+                document_id, PaperResponse(status="success", paper=paper_content)
+            ),
         )
-        
-        # Update in-memory storage
-        paper_jobs[document_id]["status"] = "success"
-        paper_jobs[document_id]["paper"] = paper_content
-        
+
     except Exception as e:
         logger.error(f"Error generating paper: {str(e)}")
-        # Update database with error status
-        await papers_collection.update_one(
-            {"_id": document_id},
-            {"$set": {"status": "error", "error": str(e), "updated_at": datetime.now()}}
+        # Record the error everywhere, concurrently as above
+        await asyncio.gather(
+            papers_collection.update_one(
+                {"_id": document_id},
+                {"$set": {"status": "error", "error": str(e), "updated_at": datetime.now(timezone.utc)}}
+            ),
+            _set_job(document_id, status="error", message=str(e)),
+            _cache_paper_status(
+                document_id, PaperResponse(status="error", message=str(e))
+            ),
         )
-        
-        # Update in-memory storage
-        paper_jobs[document_id]["status"] = "error"
-        paper_jobs[document_id]["message"] = str(e)
 
 @app.post("/api/research/generate-paper", response_model=PaperResponse)
-async def generate_paper(request: PaperRequest, background_tasks: BackgroundTasks):
+async def generate_paper(request: PaperRequest, background_tasks: BackgroundTasks,
+                         http_request: Request):
     try:
         logger.info(f"Received paper generation request for topic: {request.topic}")
-        
-        # Extract user ID from request if available
+
+        # Extract user ID from the HTTP request if available. The header
+        # lives on the Starlette Request - the pydantic body model has no
+        # headers, so the old request.headers lookup never found one.
         user_id = None
         try:
-            authorization = request.headers.get("Authorization")
+            authorization = http_request.headers.get("Authorization")
             if authorization and authorization.startswith("Bearer "):
                 token = authorization.replace("Bearer ", "")
-                decoded_token = jwt.decode(token, options={"verify_signature": False})
-                user_id = decoded_token.get("sub")
+                user_id = _decode_token(token).get("sub")
         except Exception as e:
             logger.warning(f"Error extracting user ID from request: {str(e)}")
         
         # Validate GitHub URL if provided
         if request.sourceType == "github" and request.sourceUrl:
-            from app.utils.url_validator import URLValidator
             if not URLValidator.is_valid_github_url(request.sourceUrl):
                 raise ValueError("Invalid GitHub repository URL format")
         
-        # Create a unique ID for this paper request
-        document_id = str(uuid.uuid4())
+        # Create a unique ID for this paper request. ObjectId is 12 bytes
+        # against a 36-byte UUID string, and its time-ordered prefix keeps
+        # _id index inserts in one hot B-tree region
+        document_id = ObjectId()
         
-        # Store initial data in MongoDB
-        papers_collection = db.get_collection("papers")
-        await papers_collection.insert_one({
+        # One timestamp per request, in UTC - naive local datetimes sort
+        # wrongly across timezones
+        now = datetime.now(timezone.utc)
+
+        # Store initial data in MongoDB (batched across concurrent requests)
+        await paper_insert_batcher.insert({
             "_id": document_id,
             "topic": request.topic,
             "sections": request.sections,
@@ -262,68 +398,90 @@ async def generate_paper(request: PaperRequest, background_tasks: BackgroundTask
             "source_url": request.sourceUrl,
             "user_id": user_id,
             "status": "queued",
-            "created_at": datetime.now(),
-            "updated_at": datetime.now()
+            "created_at": now,
+            "updated_at": now
         })
         
-        # Add to in-memory storage
-        paper_jobs[document_id] = {
-            "status": "processing",
-            "paper": None,
-            "message": None
-        }
+        # Record the queued job where every worker can see it
+        await _set_job(document_id, status="processing", paper=None, message=None)
         
         # Start background task to generate the paper
+        # Pass the validated model straight through - no intermediate
+        # dict materialization per request
         background_tasks.add_task(
             background_paper_generation,
             document_id,
-            request.dict(),
+            request,
             user_id
         )
         
         return PaperResponse(
             status="processing",
-            document_id=document_id
+            document_id=str(document_id)
         )
-        
+
     except Exception as e:
         logger.error(f"Error starting paper generation: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/research/paper/{document_id}", response_model=PaperResponse)
 async def get_paper_status(document_id: str):
-    # Check in-memory storage first (faster)
-    if document_id in paper_jobs:
-        job = paper_jobs[document_id]
+    # Accept both ObjectId hex ids and legacy UUID strings
+    doc_key = ObjectId(document_id) if ObjectId.is_valid(document_id) else document_id
+
+    # Check the shared job store first (Redis, or in-process fallback)
+    job = await _get_job(document_id)
+    if job is not None:
         return PaperResponse(
-            status=job["status"],
-            message=job["message"],
-            paper=job["paper"]
+            status=job.get("status"),
+            message=job.get("message"),
+            paper=job.get("paper")
         )
     
-    # If not found in memory, check database
-    papers_collection = db.get_collection("papers")
-    paper_doc = await papers_collection.find_one({"_id": document_id})
-    
+    # Then Redis - survives restarts and is shared across workers
+    cached = await _cached_paper_status(document_id)
+    if cached is not None:
+        return cached
+
+    # If not found in memory, check database. Fetch only the status
+    # fields first - shipping a multi-KB paper_content just to learn the
+    # job is still processing wastes bandwidth on every poll
+    paper_doc = await database.papers_coll.find_one(
+        {"_id": doc_key}, projection={"status": 1, "error": 1}
+    )
+
     if not paper_doc:
         raise HTTPException(status_code=404, detail="Paper not found")
-    
+
     if paper_doc["status"] == "completed":
-        return PaperResponse(
+        content_doc = await database.paper_contents_coll.find_one({"_id": doc_key})
+        if content_doc is not None:
+            paper = zlib.decompress(content_doc["content_zlib"]).decode("utf-8")
+        else:
+            # Papers written before content was split out keep the text
+            # inline on the papers document
+            legacy_doc = await database.papers_coll.find_one(
+                {"_id": doc_key}, projection={"paper_content": 1}
+            )
+            paper = (legacy_doc or {}).get("paper_content")
+        resp = PaperResponse(
             status="success",
-            paper=paper_doc["paper_content"]
+            paper=paper
         )
     elif paper_doc["status"] == "error":
-        return PaperResponse(
+        resp = PaperResponse(
             status="error",
             message=paper_doc.get("error", "Unknown error")
         )
     else:
-        return PaperResponse(
+        resp = PaperResponse(
             status="processing",
             document_id=document_id
         )
 
+    await _cache_paper_status(document_id, resp)
+    return resp
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
\ No newline at end of file
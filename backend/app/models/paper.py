@@ -1,9 +1,13 @@
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from odmantic import Model
-from datetime import datetime
+from datetime import datetime, timezone
 from odmantic import Field
 
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now (datetime.utcnow is naive and deprecated)."""
+    return datetime.now(timezone.utc)
+
 class ProcessingStatus(str, Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -37,8 +41,8 @@ class Document(Model):
     paper_pdf_url: Optional[str] = None
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     
 class Config:
     collection = "documents"
\ No newline at end of file
@@ -1,14 +1,52 @@
+import hashlib
+import logging
 import os
 import tempfile
 import subprocess
 import shutil
+import zipfile
 from typing import Dict, List, Optional
 import asyncio
 import aiohttp
 
+from app.utils.cache import github_repo_cache
+
+logger = logging.getLogger(__name__)
+
+# Fetched repositories are kept under one well-known directory so repeat
+# requests for the same repo and ref skip the network entirely. A
+# background sweep evicts the least-recently-used entries once the cache
+# grows past REPO_CACHE_MAX_BYTES.
+REPO_CACHE_DIR = os.path.join(tempfile.gettempdir(), "anushandhan_repos")
+REPO_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
 class GitHubProcessor:
     """Service for processing GitHub repositories"""
-    
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        # In-flight metadata fetches keyed by normalized URL, so concurrent
+        # requests for the same repo share one API call
+        self._metadata_inflight: Dict[str, asyncio.Task] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create one shared HTTP session. Reusing the session keeps
+        connections to GitHub alive, so repeat calls skip the TCP+TLS
+        handshake instead of paying it per request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=50),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session (call on application shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     def safe_rmtree(self, path):
         """Safely remove a directory tree, ignoring permission errors on Windows."""
         def onerror(func, error_path, exc_info):
@@ -23,16 +61,144 @@ class GitHubProcessor:
         try:
             shutil.rmtree(path, onerror=onerror)
         except Exception as e:
-            print(f"Warning: Could not fully remove directory {path}: {str(e)}")
+            logger.warning(f"Could not fully remove directory {path}: {str(e)}")
     
     async def clone_repository(self, repo_url: str, branch: str = "main") -> str:
         """
-        Clone a GitHub repository to a temporary directory
-        
+        Fetch a GitHub repository into a temporary directory
+
+        For github.com URLs this downloads the branch ZIP archive instead
+        of running git: no history is transferred and no subprocess is
+        spawned, so it's faster and fully async. Anything else (or an
+        archive failure, e.g. a non-default branch name) falls back to a
+        git clone in a worker thread.
+
         Args:
             repo_url: GitHub repository URL
-            branch: Branch to clone
-            
+            branch: Branch to fetch
+
+        Returns:
+            Path to the repository contents
+        """
+        # Serve from the on-disk cache when this (url, ref) was fetched
+        # before; the mtime touch feeds the LRU sweep
+        cache_key = hashlib.sha256(f"{repo_url.rstrip('/')}@{branch}".encode()).hexdigest()
+        cache_dir = os.path.join(REPO_CACHE_DIR, cache_key)
+        content_dir = os.path.join(cache_dir, "repo")
+        if os.path.isdir(content_dir):
+            os.utime(cache_dir, None)
+            return content_dir
+
+        if "github.com" in repo_url:
+            try:
+                fetched = await self._download_repository_archive(repo_url, branch)
+            except Exception as e:
+                logger.warning(f"Archive download failed ({str(e)}), falling back to git clone")
+                fetched = await self._clone_repository_git(repo_url)
+        else:
+            fetched = await self._clone_repository_git(repo_url)
+
+        # Move the fetched tree into the cache; caching is best-effort, so
+        # on any problem just serve the uncached path
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            shutil.move(fetched, content_dir)
+            os.utime(cache_dir, None)
+            return content_dir
+        except Exception as e:
+            logger.warning(f"Could not cache repository: {str(e)}")
+            return fetched
+
+    async def cleanup_repository_cache(self, max_bytes: int = REPO_CACHE_MAX_BYTES):
+        """
+        Evict least-recently-used cached repositories once the cache
+        exceeds max_bytes. Safe to run as a fire-and-forget task; all the
+        filesystem work happens on the threadpool.
+        """
+        await asyncio.to_thread(self._sweep_repository_cache, max_bytes)
+
+    def _sweep_repository_cache(self, max_bytes: int):
+        if not os.path.isdir(REPO_CACHE_DIR):
+            return
+
+        entries = []
+        for name in os.listdir(REPO_CACHE_DIR):
+            path = os.path.join(REPO_CACHE_DIR, name)
+            try:
+                size = sum(
+                    os.path.getsize(os.path.join(root, f))
+                    for root, _, files in os.walk(path)
+                    for f in files
+                )
+                entries.append((os.path.getmtime(path), size, path))
+            except OSError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()  # oldest access first
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            self.safe_rmtree(path)
+            total -= size
+
+    async def _download_repository_archive(self, repo_url: str, branch: str) -> str:
+        """Download and extract a branch ZIP archive from codeload.github.com."""
+        parts = repo_url.rstrip('/').split('/')
+        owner = parts[-2]
+        repo = parts[-1]
+        if repo.endswith(".git"):
+            repo = repo[:-4]
+
+        archive_url = f"https://codeload.github.com/{owner}/{repo}/zip/refs/heads/{branch}"
+        temp_dir = tempfile.mkdtemp()
+        archive_path = os.path.join(temp_dir, "repo.zip")
+
+        try:
+            session = await self._get_session()
+            # Large archives can outlive the session's default timeout
+            async with session.get(archive_url, timeout=aiohttp.ClientTimeout(total=300)) as response:
+                if response.status != 200:
+                    raise Exception(f"Archive request returned status {response.status}")
+                with open(archive_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(1 << 16):
+                        f.write(chunk)
+
+            # Extraction is blocking IO, so run it in the thread pool
+            extract_dir = os.path.join(temp_dir, "repo")
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._extract_archive, archive_path, extract_dir)
+            os.remove(archive_path)
+
+            # GitHub archives wrap everything in a single {repo}-{branch}/ dir
+            entries = os.listdir(extract_dir)
+            if len(entries) == 1:
+                return os.path.join(extract_dir, entries[0])
+            return extract_dir
+
+        except Exception:
+            if os.path.exists(temp_dir):
+                await asyncio.to_thread(self.safe_rmtree, temp_dir)
+            raise
+
+    def _extract_archive(self, archive_path: str, extract_dir: str):
+        """Extract a ZIP archive, rejecting members that escape the target dir."""
+        with zipfile.ZipFile(archive_path) as archive:
+            base = os.path.realpath(extract_dir)
+            for member in archive.namelist():
+                # Zip-Slip guard: never extract outside the target directory
+                target = os.path.realpath(os.path.join(extract_dir, member))
+                if target != base and not target.startswith(base + os.sep):
+                    raise Exception(f"Unsafe path in archive: {member}")
+            archive.extractall(extract_dir)
+
+    async def _clone_repository_git(self, repo_url: str) -> str:
+        """
+        Clone a repository with git as a fallback
+
+        Args:
+            repo_url: Repository URL
+
         Returns:
             Path to the cloned repository
         """
@@ -60,21 +226,28 @@ class GitHubProcessor:
         except Exception as e:
             # Clean up on error
             if os.path.exists(temp_dir):
-                self.safe_rmtree(temp_dir)
+                await asyncio.to_thread(self.safe_rmtree, temp_dir)
             raise Exception(f"Repository cloning error: {str(e)}")
     
     async def read_repository_files(self, repo_path: str) -> Dict[str, str]:
         """
         Read all files from the repository
-        
+
+        The os.walk/open loop is synchronous, so it runs on the thread
+        pool - otherwise reading a large repo would block the event loop
+        and stall every other in-flight request.
+
         Args:
             repo_path: Path to the repository
-            
+
         Returns:
             Dictionary mapping file paths to file content
         """
+        return await asyncio.to_thread(self._read_repository_files, repo_path)
+
+    def _read_repository_files(self, repo_path: str) -> Dict[str, str]:
         result = {}
-        
+
         for root, _, files in os.walk(repo_path):
             for file in files:
                 file_path = os.path.join(root, file)
@@ -95,6 +268,29 @@ class GitHubProcessor:
         
         return result
     
+    async def get_latest_commit_sha(self, repo_url: str) -> str:
+        """
+        Get the SHA of the latest commit on the repository's default branch
+
+        Args:
+            repo_url: GitHub repository URL
+
+        Returns:
+            Commit SHA string
+        """
+        parts = repo_url.rstrip('/').split('/')
+        owner = parts[-2]
+        repo = parts[-1]
+
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/commits/HEAD"
+
+        session = await self._get_session()
+        async with session.get(api_url, headers={"Accept": "application/vnd.github.sha"}) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to get latest commit SHA: {await response.text()}")
+
+            return (await response.text()).strip()
+
     async def get_repository_metadata(self, repo_url: str) -> Dict[str, any]:
         """
         Get metadata about a GitHub repository
@@ -105,29 +301,48 @@ class GitHubProcessor:
         Returns:
             Dictionary with repository metadata
         """
+        # Repo metadata only changes on pushes and the API is rate-limited,
+        # so serve repeat lookups from a short-lived cache
+        cache_key = repo_url.rstrip('/').lower()
+        cached = github_repo_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent cache misses for the same repo into a single
+        # API call instead of letting them stampede
+        task = self._metadata_inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_repository_metadata(cache_key, repo_url))
+            self._metadata_inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._metadata_inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_repository_metadata(self, cache_key: str, repo_url: str) -> Dict[str, any]:
         # Extract owner and repo name from URL
         # Example: https://github.com/owner/repo
         parts = repo_url.rstrip('/').split('/')
         owner = parts[-2]
         repo = parts[-1]
-        
+
         # GitHub API URL
         api_url = f"https://api.github.com/repos/{owner}/{repo}"
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to get repository metadata: {await response.text()}")
-                
-                data = await response.json()
-                
-                return {
-                    "name": data.get("name"),
-                    "owner": data.get("owner", {}).get("login"),
-                    "description": data.get("description"),
-                    "stars": data.get("stargazers_count"),
-                    "forks": data.get("forks_count"),
-                    "language": data.get("language"),
-                    "created_at": data.get("created_at"),
-                    "updated_at": data.get("updated_at")
-                }
\ No newline at end of file
+
+        session = await self._get_session()
+        async with session.get(api_url) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to get repository metadata: {await response.text()}")
+
+            data = await response.json()
+
+            metadata = {
+                "name": data.get("name"),
+                "owner": data.get("owner", {}).get("login"),
+                "description": data.get("description"),
+                "stars": data.get("stargazers_count"),
+                "forks": data.get("forks_count"),
+                "language": data.get("language"),
+                "created_at": data.get("created_at"),
+                "updated_at": data.get("updated_at")
+            }
+            github_repo_cache.set(cache_key, metadata, ttl=300)
+            return metadata
\ No newline at end of file
@@ -413,34 +413,35 @@ class GitHubPaperGenerator:
                     "References"
                 ]
                 
-            # Generate paper content
-            paper_content = f"# {metadata.get('name', 'Repository Analysis')}: {topic}\n\n"
+            # Generate paper content, collected as a list and joined once
+            # at the end - += on a string recopies the whole paper per line
+            parts = [f"# {metadata.get('name', 'Repository Analysis')}: {topic}\n\n"]
             
             # Add IEEE-style metadata
-            paper_content += "## IEEE Conference Paper\n\n"
-            paper_content += f"**Repository**: {metadata.get('full_name', 'Unknown')}\n"
-            paper_content += f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n"
-            paper_content += f"**URL**: {repo_url}\n\n"
+            parts.append("## IEEE Conference Paper\n\n")
+            parts.append(f"**Repository**: {metadata.get('full_name', 'Unknown')}\n")
+            parts.append(f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n")
+            parts.append(f"**URL**: {repo_url}\n\n")
             
             # Add abstract
-            paper_content += "## Abstract\n\n"
-            paper_content += f"This paper analyzes the software architecture and implementation of {metadata.get('name', 'the repository')}, "
-            paper_content += f"a {next(iter(languages)) if languages else 'software'} project "
-            paper_content += f"with {metadata.get('stargazers_count', 0)} stars on GitHub. "
-            paper_content += f"{metadata.get('description', '')} "
-            paper_content += "The analysis explores the codebase structure, architectural patterns, "
-            paper_content += "implementation details, and potential applications. "
-            paper_content += "This research provides insights into software engineering practices "
-            paper_content += f"employed in {metadata.get('name', 'this repository')}.\n\n"
+            parts.append("## Abstract\n\n")
+            parts.append(f"This paper analyzes the software architecture and implementation of {metadata.get('name', 'the repository')}, ")
+            parts.append(f"a {next(iter(languages)) if languages else 'software'} project ")
+            parts.append(f"with {metadata.get('stargazers_count', 0)} stars on GitHub. ")
+            parts.append(f"{metadata.get('description', '')} ")
+            parts.append("The analysis explores the codebase structure, architectural patterns, ")
+            parts.append("implementation details, and potential applications. ")
+            parts.append("This research provides insights into software engineering practices ")
+            parts.append(f"employed in {metadata.get('name', 'this repository')}.\n\n")
             
             # Add introduction
-            paper_content += "## Introduction\n\n"
-            paper_content += f"{metadata.get('name', 'This repository')} is "
+            parts.append("## Introduction\n\n")
+            parts.append(f"{metadata.get('name', 'This repository')} is ")
             if metadata.get('description'):
-                paper_content += f"described as '{metadata.get('description')}'. "
-            paper_content += f"Created on {metadata.get('created_at', 'unknown date')}, "
-            paper_content += f"it has garnered attention with {metadata.get('stargazers_count', 0)} stars and "
-            paper_content += f"{metadata.get('forks_count', 0)} forks. "
+                parts.append(f"described as '{metadata.get('description')}'. ")
+            parts.append(f"Created on {metadata.get('created_at', 'unknown date')}, ")
+            parts.append(f"it has garnered attention with {metadata.get('stargazers_count', 0)} stars and ")
+            parts.append(f"{metadata.get('forks_count', 0)} forks. ")
             
             # Add language information
             if languages:
@@ -448,174 +449,174 @@ class GitHubPaperGenerator:
                 lang_percentages = {k: (v / total_bytes) * 100 for k, v in languages.items()}
                 top_languages = sorted(lang_percentages.items(), key=lambda x: x[1], reverse=True)[:3]
                 
-                paper_content += "The codebase primarily utilizes "
+                parts.append("The codebase primarily utilizes ")
                 if len(top_languages) == 1:
-                    paper_content += f"{top_languages[0][0]} (100%). "
+                    parts.append(f"{top_languages[0][0]} (100%). ")
                 else:
                     lang_description = ", ".join([f"{lang} ({percentage:.1f}%)" for lang, percentage in top_languages])
-                    paper_content += f"a combination of {lang_description}. "
+                    parts.append(f"a combination of {lang_description}. ")
                     
             # Add README summary if available
             if readme:
-                paper_content += "\n\nFrom the project README:\n\n"
-                paper_content += "> " + "\n> ".join(readme.split("\n")[:10])
+                parts.append("\n\nFrom the project README:\n\n")
+                parts.append("> " + "\n> ".join(readme.split("\n")[:10]))
                 if len(readme.split("\n")) > 10:
-                    paper_content += "\n> ..."
-                paper_content += "\n\n"
+                    parts.append("\n> ...")
+                parts.append("\n\n")
                 
             # Add methodology
-            paper_content += "## Methodology\n\n"
-            paper_content += "This research paper employs static code analysis techniques to examine "
-            paper_content += f"the structure and patterns within {metadata.get('name', 'the repository')}. "
-            paper_content += "The methodology includes:\n\n"
-            paper_content += "1. Repository structure analysis\n"
-            paper_content += "2. Programming language composition assessment\n"
-            paper_content += "3. Code organization patterns identification\n"
-            paper_content += "4. Examination of key components and their interactions\n"
-            paper_content += "5. Analysis of API design and implementation\n\n"
+            parts.append("## Methodology\n\n")
+            parts.append("This research paper employs static code analysis techniques to examine ")
+            parts.append(f"the structure and patterns within {metadata.get('name', 'the repository')}. ")
+            parts.append("The methodology includes:\n\n")
+            parts.append("1. Repository structure analysis\n")
+            parts.append("2. Programming language composition assessment\n")
+            parts.append("3. Code organization patterns identification\n")
+            parts.append("4. Examination of key components and their interactions\n")
+            parts.append("5. Analysis of API design and implementation\n\n")
             
             # Add file analysis
             if sampled_files:
-                paper_content += "## Code Analysis\n\n"
-                paper_content += "The following key files were analyzed to understand the system architecture:\n\n"
+                parts.append("## Code Analysis\n\n")
+                parts.append("The following key files were analyzed to understand the system architecture:\n\n")
                 
                 for file in sampled_files:
-                    paper_content += f"### {file['path']}\n\n"
+                    parts.append(f"### {file['path']}\n\n")
                     
                     # Add file content snippet
-                    paper_content += "```\n"
+                    parts.append("```\n")
                     # Limit code snippet to a reasonable size
                     lines = file['content'].split('\n')[:50]
-                    paper_content += "\n".join(lines)
+                    parts.append("\n".join(lines))
                     if len(file['content'].split('\n')) > 50:
-                        paper_content += "\n..."
-                    paper_content += "\n```\n\n"
+                        parts.append("\n...")
+                    parts.append("\n```\n\n")
                     
                     # Add brief analysis
-                    paper_content += "This file "
+                    parts.append("This file ")
                     if file['path'].endswith('.py'):
-                        paper_content += "contains Python code "
+                        parts.append("contains Python code ")
                         # Look for classes and functions
                         classes = re.findall(r'class\s+(\w+)', file['content'])
                         functions = re.findall(r'def\s+(\w+)', file['content'])
                         
                         if classes:
-                            paper_content += f"with {len(classes)} classes"
+                            parts.append(f"with {len(classes)} classes")
                             if functions:
-                                paper_content += f" and {len(functions)} functions. "
+                                parts.append(f" and {len(functions)} functions. ")
                             else:
-                                paper_content += ". "
+                                parts.append(". ")
                         elif functions:
-                            paper_content += f"with {len(functions)} functions. "
+                            parts.append(f"with {len(functions)} functions. ")
                             
                     elif file['path'].endswith('.js') or file['path'].endswith('.jsx'):
-                        paper_content += "implements JavaScript functionality "
+                        parts.append("implements JavaScript functionality ")
                         functions = re.findall(r'function\s+(\w+)', file['content'])
                         if functions:
-                            paper_content += f"with {len(functions)} named functions. "
+                            parts.append(f"with {len(functions)} named functions. ")
                         
-                    paper_content += "The code demonstrates "
+                    parts.append("The code demonstrates ")
                     
                     # Add some generic analysis based on file type
                     if 'test' in file['path'].lower():
-                        paper_content += "testing implementation for ensuring code quality. "
+                        parts.append("testing implementation for ensuring code quality. ")
                     elif 'model' in file['path'].lower():
-                        paper_content += "data modeling and structure definitions. "
+                        parts.append("data modeling and structure definitions. ")
                     elif 'view' in file['path'].lower() or 'component' in file['path'].lower():
-                        paper_content += "UI rendering and user interface components. "
+                        parts.append("UI rendering and user interface components. ")
                     elif 'controller' in file['path'].lower() or 'service' in file['path'].lower():
-                        paper_content += "business logic and service implementation. "
+                        parts.append("business logic and service implementation. ")
                     elif 'util' in file['path'].lower() or 'helper' in file['path'].lower():
-                        paper_content += "utility functions and helper methods. "
+                        parts.append("utility functions and helper methods. ")
                     else:
-                        paper_content += "core functionality of the application. "
+                        parts.append("core functionality of the application. ")
                         
-                    paper_content += "\n\n"
+                    parts.append("\n\n")
             
             # Add results/discussion
-            paper_content += "## Results and Discussion\n\n"
-            paper_content += f"The analysis of {metadata.get('name', 'the repository')} reveals several key findings:\n\n"
+            parts.append("## Results and Discussion\n\n")
+            parts.append(f"The analysis of {metadata.get('name', 'the repository')} reveals several key findings:\n\n")
             
             # Add architecture observations
-            paper_content += "### Architecture\n\n"
+            parts.append("### Architecture\n\n")
             if any('component' in file['path'].lower() for file in sampled_files):
-                paper_content += "The codebase employs a component-based architecture, "
-                paper_content += "separating functionality into reusable components. "
+                parts.append("The codebase employs a component-based architecture, ")
+                parts.append("separating functionality into reusable components. ")
             elif any('controller' in file['path'].lower() and 'model' in file['path'].lower() for file in sampled_files):
-                paper_content += "The project follows an MVC (Model-View-Controller) pattern, "
-                paper_content += "separating data, business logic, and presentation concerns. "
+                parts.append("The project follows an MVC (Model-View-Controller) pattern, ")
+                parts.append("separating data, business logic, and presentation concerns. ")
             elif any('service' in file['path'].lower() for file in sampled_files):
-                paper_content += "The system utilizes a service-oriented architecture, "
-                paper_content += "with clearly defined service boundaries. "
+                parts.append("The system utilizes a service-oriented architecture, ")
+                parts.append("with clearly defined service boundaries. ")
             else:
-                paper_content += "The code demonstrates a modular structure with separation of concerns. "
+                parts.append("The code demonstrates a modular structure with separation of concerns. ")
                 
             # Add language-specific observations
             dominant_language = next(iter(languages)) if languages else None
             if dominant_language:
-                paper_content += f"\n\n### {dominant_language} Implementation\n\n"
+                parts.append(f"\n\n### {dominant_language} Implementation\n\n")
                 if dominant_language == "JavaScript":
-                    paper_content += "The JavaScript implementation "
+                    parts.append("The JavaScript implementation ")
                     if any('react' in file['content'].lower() or 'component' in file['content'].lower() for file in sampled_files):
-                        paper_content += "utilizes React for frontend development, with component-based UI architecture. "
+                        parts.append("utilizes React for frontend development, with component-based UI architecture. ")
                     elif any('node' in file['content'].lower() or 'express' in file['content'].lower() for file in sampled_files):
-                        paper_content += "employs Node.js with Express for server-side functionality. "
+                        parts.append("employs Node.js with Express for server-side functionality. ")
                     else:
-                        paper_content += "demonstrates modern JavaScript patterns and practices. "
+                        parts.append("demonstrates modern JavaScript patterns and practices. ")
                 elif dominant_language == "Python":
-                    paper_content += "The Python implementation "
+                    parts.append("The Python implementation ")
                     if any('flask' in file['content'].lower() for file in sampled_files):
-                        paper_content += "uses Flask for web service functionality. "
+                        parts.append("uses Flask for web service functionality. ")
                     elif any('django' in file['content'].lower() for file in sampled_files):
-                        paper_content += "is built on Django, providing a robust web framework foundation. "
+                        parts.append("is built on Django, providing a robust web framework foundation. ")
                     else:
-                        paper_content += "follows Pythonic principles and coding standards. "
+                        parts.append("follows Pythonic principles and coding standards. ")
                         
             # Add quality observations
-            paper_content += "\n\n### Code Quality\n\n"
+            parts.append("\n\n### Code Quality\n\n")
             has_tests = any('test' in file['path'].lower() for file in sampled_files)
             if has_tests:
-                paper_content += "The presence of test files indicates a commitment to code quality and reliability. "
+                parts.append("The presence of test files indicates a commitment to code quality and reliability. ")
             else:
-                paper_content += "The codebase could benefit from more comprehensive test coverage. "
+                parts.append("The codebase could benefit from more comprehensive test coverage. ")
                 
             # Add documentation observations
-            paper_content += "Documentation is "
+            parts.append("Documentation is ")
             if readme and len(readme) > 500:
-                paper_content += "fairly comprehensive, with detailed README information. "
+                parts.append("fairly comprehensive, with detailed README information. ")
             else:
-                paper_content += "present but could be expanded with more detailed implementation information. "
+                parts.append("present but could be expanded with more detailed implementation information. ")
                 
             # Add conclusion
-            paper_content += "\n\n## Conclusion\n\n"
-            paper_content += f"This analysis of {metadata.get('name', 'the repository')} provides insights into "
-            paper_content += "modern software development practices and architectural patterns. "
-            paper_content += f"With {metadata.get('stargazers_count', 0)} stars and {metadata.get('forks_count', 0)} forks, "
-            paper_content += "the project demonstrates significant community interest. "
-            paper_content += "The codebase exhibits "
+            parts.append("\n\n## Conclusion\n\n")
+            parts.append(f"This analysis of {metadata.get('name', 'the repository')} provides insights into ")
+            parts.append("modern software development practices and architectural patterns. ")
+            parts.append(f"With {metadata.get('stargazers_count', 0)} stars and {metadata.get('forks_count', 0)} forks, ")
+            parts.append("the project demonstrates significant community interest. ")
+            parts.append("The codebase exhibits ")
             
             if languages and len(languages) > 3:
-                paper_content += "a diverse technology stack, "
+                parts.append("a diverse technology stack, ")
             else:
-                paper_content += f"focused use of {dominant_language if dominant_language else 'programming languages'}, "
+                parts.append(f"focused use of {dominant_language if dominant_language else 'programming languages'}, ")
                 
             if has_tests:
-                paper_content += "with attention to testing and quality control. "
+                parts.append("with attention to testing and quality control. ")
             else:
-                paper_content += "with opportunities for enhanced testing coverage. "
+                parts.append("with opportunities for enhanced testing coverage. ")
                 
-            paper_content += "\n\nFuture research could explore performance optimizations, security aspects, "
-            paper_content += "or comparative analysis with similar projects in the domain."
+            parts.append("\n\nFuture research could explore performance optimizations, security aspects, ")
+            parts.append("or comparative analysis with similar projects in the domain.")
             
             # Add references
-            paper_content += "\n\n## References\n\n"
-            paper_content += f"1. {metadata.get('full_name', 'Repository')}, GitHub, {repo_url}\n"
-            paper_content += "2. IEEE Standard for Software Engineering, IEEE Std 1016-2009\n"
-            paper_content += "3. C. Northrop, \"Software Architecture in Practice,\" Addison-Wesley, 2012\n"
-            paper_content += "4. M. Fowler, \"Patterns of Enterprise Application Architecture,\" Addison-Wesley, 2002\n"
-            paper_content += "5. R. Martin, \"Clean Code: A Handbook of Agile Software Craftsmanship,\" Prentice Hall, 2008\n"
+            parts.append("\n\n## References\n\n")
+            parts.append(f"1. {metadata.get('full_name', 'Repository')}, GitHub, {repo_url}\n")
+            parts.append("2. IEEE Standard for Software Engineering, IEEE Std 1016-2009\n")
+            parts.append("3. C. Northrop, \"Software Architecture in Practice,\" Addison-Wesley, 2012\n")
+            parts.append("4. M. Fowler, \"Patterns of Enterprise Application Architecture,\" Addison-Wesley, 2002\n")
+            parts.append("5. R. Martin, \"Clean Code: A Handbook of Agile Software Craftsmanship,\" Prentice Hall, 2008\n")
             
-            return paper_content
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Error generating research paper: {str(e)}")
@@ -640,95 +641,95 @@ class GitHubPaperGenerator:
         owner_name = repo_parts[-2] if len(repo_parts) >= 2 else "owner"
         
         # Generate paper content with error information
-        paper_content = f"# Limited Analysis of {owner_name}/{repo_name}\n\n"
+        parts = [f"# Limited Analysis of {owner_name}/{repo_name}\n\n"]
         
         # Add IEEE-style metadata
-        paper_content += "## IEEE Conference Paper\n\n"
-        paper_content += f"**Repository**: {owner_name}/{repo_name}\n"
-        paper_content += f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n"
-        paper_content += f"**URL**: {repo_url}\n\n"
+        parts.append("## IEEE Conference Paper\n\n")
+        parts.append(f"**Repository**: {owner_name}/{repo_name}\n")
+        parts.append(f"**Date**: {datetime.now().strftime('%B %d, %Y')}\n")
+        parts.append(f"**URL**: {repo_url}\n\n")
         
         # Add notice about limited analysis
-        paper_content += "## ⚠️ Limited Repository Analysis\n\n"
-        paper_content += f"This paper provides a limited analysis of the repository due to data access constraints. "
-        paper_content += f"The following error was encountered: **{error_message}**\n\n"
-        paper_content += "The analysis below is based on available repository metadata and general "
-        paper_content += "software engineering principles relevant to similar repositories.\n\n"
+        parts.append("## ⚠️ Limited Repository Analysis\n\n")
+        parts.append(f"This paper provides a limited analysis of the repository due to data access constraints. ")
+        parts.append(f"The following error was encountered: **{error_message}**\n\n")
+        parts.append("The analysis below is based on available repository metadata and general ")
+        parts.append("software engineering principles relevant to similar repositories.\n\n")
         
         # Add abstract
-        paper_content += "## Abstract\n\n"
-        paper_content += f"This paper attempts to analyze the software architecture and implementation of {repo_name}, "
-        paper_content += f"a project hosted on GitHub. While complete repository data was not accessible due to "
-        paper_content += f"technical limitations, this analysis provides valuable insights into software engineering "
-        paper_content += f"considerations for similar projects. This research examines potential architectural patterns, "
-        paper_content += f"implementation approaches, and development practices that would be relevant for {repo_name}.\n\n"
+        parts.append("## Abstract\n\n")
+        parts.append(f"This paper attempts to analyze the software architecture and implementation of {repo_name}, ")
+        parts.append(f"a project hosted on GitHub. While complete repository data was not accessible due to ")
+        parts.append(f"technical limitations, this analysis provides valuable insights into software engineering ")
+        parts.append(f"considerations for similar projects. This research examines potential architectural patterns, ")
+        parts.append(f"implementation approaches, and development practices that would be relevant for {repo_name}.\n\n")
         
         # Add introduction
-        paper_content += "## Introduction\n\n"
-        paper_content += f"GitHub repositories like {owner_name}/{repo_name} represent the modern approach to "
-        paper_content += "collaborative software development. While this specific repository's contents could not be "
-        paper_content += "fully accessed, we can still explore the broader context of software engineering approaches "
-        paper_content += "that would apply to similar projects.\n\n"
-        paper_content += "GitHub repositories typically contain source code, documentation, configuration files, "
-        paper_content += "and other assets necessary for software development. They facilitate version control, "
-        paper_content += "collaboration, issue tracking, and continuous integration/deployment.\n\n"
+        parts.append("## Introduction\n\n")
+        parts.append(f"GitHub repositories like {owner_name}/{repo_name} represent the modern approach to ")
+        parts.append("collaborative software development. While this specific repository's contents could not be ")
+        parts.append("fully accessed, we can still explore the broader context of software engineering approaches ")
+        parts.append("that would apply to similar projects.\n\n")
+        parts.append("GitHub repositories typically contain source code, documentation, configuration files, ")
+        parts.append("and other assets necessary for software development. They facilitate version control, ")
+        parts.append("collaboration, issue tracking, and continuous integration/deployment.\n\n")
         
         # Add methodology section with limitations
-        paper_content += "## Methodology and Limitations\n\n"
-        paper_content += "This research faced significant limitations in data collection. The standard methodology "
-        paper_content += "would involve:\n\n"
-        paper_content += "1. Repository structure analysis\n"
-        paper_content += "2. Programming language composition assessment\n"
-        paper_content += "3. Code organization patterns identification\n"
-        paper_content += "4. Examination of key components and their interactions\n\n"
+        parts.append("## Methodology and Limitations\n\n")
+        parts.append("This research faced significant limitations in data collection. The standard methodology ")
+        parts.append("would involve:\n\n")
+        parts.append("1. Repository structure analysis\n")
+        parts.append("2. Programming language composition assessment\n")
+        parts.append("3. Code organization patterns identification\n")
+        parts.append("4. Examination of key components and their interactions\n\n")
         
-        paper_content += "However, due to access constraints, a modified approach was necessary. This paper "
-        paper_content += "instead focuses on:\n\n"
-        paper_content += "1. General software engineering principles applicable to GitHub projects\n"
-        paper_content += "2. Common architectural patterns in modern software development\n"
-        paper_content += "3. Best practices for repository organization and management\n"
-        paper_content += "4. Theoretical analysis based on repository metadata\n\n"
+        parts.append("However, due to access constraints, a modified approach was necessary. This paper ")
+        parts.append("instead focuses on:\n\n")
+        parts.append("1. General software engineering principles applicable to GitHub projects\n")
+        parts.append("2. Common architectural patterns in modern software development\n")
+        parts.append("3. Best practices for repository organization and management\n")
+        parts.append("4. Theoretical analysis based on repository metadata\n\n")
         
         # Add general best practices
-        paper_content += "## Software Engineering Best Practices\n\n"
-        paper_content += "While specific details of the repository cannot be analyzed, we can discuss "
-        paper_content += "software engineering best practices that should be applied to all repositories:\n\n"
+        parts.append("## Software Engineering Best Practices\n\n")
+        parts.append("While specific details of the repository cannot be analyzed, we can discuss ")
+        parts.append("software engineering best practices that should be applied to all repositories:\n\n")
         
-        paper_content += "### Code Organization\n\n"
-        paper_content += "Well-structured repositories typically organize code into logical modules or packages. "
-        paper_content += "This separation of concerns improves maintainability and allows different team members "
-        paper_content += "to work on separate components simultaneously.\n\n"
+        parts.append("### Code Organization\n\n")
+        parts.append("Well-structured repositories typically organize code into logical modules or packages. ")
+        parts.append("This separation of concerns improves maintainability and allows different team members ")
+        parts.append("to work on separate components simultaneously.\n\n")
         
-        paper_content += "### Documentation\n\n"
-        paper_content += "Comprehensive documentation is essential for any software project. This includes:\n\n"
-        paper_content += "- README files explaining project purpose and setup\n"
-        paper_content += "- API documentation for developers\n"
-        paper_content += "- Architecture diagrams showing component relationships\n"
-        paper_content += "- Code comments explaining complex implementations\n\n"
+        parts.append("### Documentation\n\n")
+        parts.append("Comprehensive documentation is essential for any software project. This includes:\n\n")
+        parts.append("- README files explaining project purpose and setup\n")
+        parts.append("- API documentation for developers\n")
+        parts.append("- Architecture diagrams showing component relationships\n")
+        parts.append("- Code comments explaining complex implementations\n\n")
         
-        paper_content += "### Testing\n\n"
-        paper_content += "Robust testing strategies are critical for maintaining software quality. These typically include:\n\n"
-        paper_content += "- Unit tests for individual functions and methods\n"
-        paper_content += "- Integration tests for component interactions\n"
-        paper_content += "- End-to-end tests simulating user workflows\n"
-        paper_content += "- Performance tests ensuring system efficiency\n\n"
+        parts.append("### Testing\n\n")
+        parts.append("Robust testing strategies are critical for maintaining software quality. These typically include:\n\n")
+        parts.append("- Unit tests for individual functions and methods\n")
+        parts.append("- Integration tests for component interactions\n")
+        parts.append("- End-to-end tests simulating user workflows\n")
+        parts.append("- Performance tests ensuring system efficiency\n\n")
         
         # Add conclusion
-        paper_content += "## Conclusion\n\n"
-        paper_content += f"While this analysis of {owner_name}/{repo_name} faced significant limitations in data access, "
-        paper_content += "it highlights the importance of software engineering principles in GitHub-based development. "
-        paper_content += "Future research could address these limitations by working directly with repository maintainers "
-        paper_content += "to gain proper access for analysis.\n\n"
-        paper_content += "The theoretical framework presented here provides valuable insights for developers "
-        paper_content += "working on similar projects, emphasizing code organization, documentation, and testing "
-        paper_content += "as pillars of successful software development.\n\n"
+        parts.append("## Conclusion\n\n")
+        parts.append(f"While this analysis of {owner_name}/{repo_name} faced significant limitations in data access, ")
+        parts.append("it highlights the importance of software engineering principles in GitHub-based development. ")
+        parts.append("Future research could address these limitations by working directly with repository maintainers ")
+        parts.append("to gain proper access for analysis.\n\n")
+        parts.append("The theoretical framework presented here provides valuable insights for developers ")
+        parts.append("working on similar projects, emphasizing code organization, documentation, and testing ")
+        parts.append("as pillars of successful software development.\n\n")
         
         # Add references
-        paper_content += "## References\n\n"
-        paper_content += f"1. {owner_name}/{repo_name}, GitHub, {repo_url}\n"
-        paper_content += "2. IEEE Standard for Software Engineering, IEEE Std 1016-2009\n"
-        paper_content += "3. C. Northrop, \"Software Architecture in Practice,\" Addison-Wesley, 2012\n"
-        paper_content += "4. M. Fowler, \"Patterns of Enterprise Application Architecture,\" Addison-Wesley, 2002\n"
-        paper_content += "5. R. Martin, \"Clean Code: A Handbook of Agile Software Craftsmanship,\" Prentice Hall, 2008\n"
+        parts.append("## References\n\n")
+        parts.append(f"1. {owner_name}/{repo_name}, GitHub, {repo_url}\n")
+        parts.append("2. IEEE Standard for Software Engineering, IEEE Std 1016-2009\n")
+        parts.append("3. C. Northrop, \"Software Architecture in Practice,\" Addison-Wesley, 2012\n")
+        parts.append("4. M. Fowler, \"Patterns of Enterprise Application Architecture,\" Addison-Wesley, 2002\n")
+        parts.append("5. R. Martin, \"Clean Code: A Handbook of Agile Software Craftsmanship,\" Prentice Hall, 2008\n")
         
-        return paper_content
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -5,17 +5,20 @@ import logging
 logger = logging.getLogger(__name__)
 
 class CacheManager:
-    """Simple in-memory cache manager with TTL (time-to-live)"""
-    
-    def __init__(self, default_ttl=3600):  # Default TTL: 1 hour
+    """Simple in-memory cache manager with TTL (time-to-live) and a size cap"""
+
+    def __init__(self, default_ttl=3600, maxsize=10_000):  # Default TTL: 1 hour
         """
         Initialize the cache manager.
-        
+
         Args:
             default_ttl (int): Default time-to-live in seconds
+            maxsize (int): Maximum number of entries; the least recently
+                used entry is evicted when the cap is exceeded
         """
         self._cache = {}
         self._default_ttl = default_ttl
+        self._maxsize = maxsize
         
     def get(self, key):
         """
@@ -39,6 +42,11 @@ class CacheManager:
             self._cache.pop(key, None)
             return None
             
+        # Re-insert on hit so insertion order doubles as recency order
+        # and eviction drops the least recently used key
+        self._cache.pop(key)
+        self._cache[key] = cache_entry
+
         logger.debug(f"Cache hit for key: {key}")
         return cache_entry['value']
         
@@ -56,12 +64,22 @@ class CacheManager:
             
         expires_at = time.time() + ttl
         
+        self._cache.pop(key, None)
         self._cache[key] = {
             'value': value,
             'expires_at': expires_at,
             'created_at': datetime.now()
         }
-        
+
+        # Keep the cache bounded: drop expired entries first, then the
+        # least recently used until back under the cap
+        if len(self._cache) > self._maxsize:
+            self.cleanup()
+            while len(self._cache) > self._maxsize:
+                evicted = next(iter(self._cache))
+                self._cache.pop(evicted)
+                logger.debug(f"Cache evicted LRU key: {evicted}")
+
         logger.debug(f"Cache set for key: {key}, expires in {ttl} seconds")
         
     def invalidate(self, key):
@@ -102,6 +102,44 @@ class PaperHumanizer:
             logger.error(f"Error in humanization: {str(e)}")
             return content  # Return original content if humanization fails
     
+    async def humanize_content_stream(self, chunks, section_type: str) -> str:
+        """
+        Humanize content as it streams in from the generator
+
+        Completed paragraphs are processed while later ones are still
+        being produced, overlapping the CPU work with the network wait.
+
+        Args:
+            chunks: Async iterator yielding text deltas
+            section_type: Type of section (abstract, introduction, etc.)
+
+        Returns:
+            Humanized content
+        """
+        processed_paragraphs = []
+        buffer = ""
+        index = 0
+
+        def process(paragraph: str) -> None:
+            nonlocal index
+            try:
+                processed_paragraphs.append(self._process_paragraph(paragraph, index, section_type))
+            except Exception as e:
+                logger.error(f"Error humanizing paragraph: {str(e)}")
+                processed_paragraphs.append(paragraph)
+            index += 1
+
+        async for chunk in chunks:
+            buffer += chunk
+            while '\n\n' in buffer:
+                paragraph, buffer = buffer.split('\n\n', 1)
+                if paragraph.strip():
+                    process(paragraph.strip())
+        if buffer.strip():
+            process(buffer.strip())
+
+        return self._final_polish('\n\n'.join(processed_paragraphs), section_type)
+
     def _process_paragraph(self, paragraph: str, paragraph_index: int, section_type: str) -> str:
         """Process a single paragraph for humanization"""
         # Split into sentences